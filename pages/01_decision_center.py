@@ -16,7 +16,7 @@ from datetime import datetime
 sys.path.append(str(Path(__file__).parent.parent / 'src'))
 
 from decision_engine import DecisionEngine
-from ui_components import get_common_css, page_header, section_header
+from ui_components import inject_critical_css, inject_deferred_css, page_header, section_header
 
 # Page config
 st.set_page_config(
@@ -26,7 +26,7 @@ st.set_page_config(
 )
 
 # Apply common CSS
-st.markdown(get_common_css(), unsafe_allow_html=True)
+inject_critical_css()
 
 # Additional page-specific CSS
 st.markdown("""
@@ -424,3 +424,6 @@ with action_col4:
 # Footer
 st.divider()
 st.caption(f"🕐 Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | Data refresh every 5 minutes")
+
+# Non-critical styles, sent after the page content
+inject_deferred_css()
@@ -17,7 +17,7 @@ sys.path.append(str(Path(__file__).parent.parent / 'src'))
 
 from ai_predictor import FloodPredictor, generate_rainfall_forecast
 from data_loader import LiDARDataset
-from ui_components import get_common_css, page_header, section_header
+from ui_components import inject_critical_css, inject_deferred_css, page_header, section_header
 
 # Page config
 st.set_page_config(
@@ -27,7 +27,7 @@ st.set_page_config(
 )
 
 # Custom CSS
-st.markdown(get_common_css(), unsafe_allow_html=True)
+inject_critical_css()
 
 st.markdown("""
 <style>
@@ -490,3 +490,6 @@ for rec in recommendations:
 
 # Footer
 st.caption(f"🕐 Prediction generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | Model version: 1.0 | Confidence: {prediction['confidence']:.0%}")
+
+# Non-critical styles, sent after the page content
+inject_deferred_css()
@@ -15,7 +15,7 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from src.community_db import CommunityDatabase
-from src.ui_components import get_common_css, page_header, section_header
+from src.ui_components import inject_critical_css, inject_deferred_css, page_header, section_header
 
 st.set_page_config(
     page_title="Community Portal - Aqua Guardians",
@@ -24,7 +24,7 @@ st.set_page_config(
 )
 
 # Apply common CSS
-st.markdown(get_common_css(), unsafe_allow_html=True)
+inject_critical_css()
 
 # Initialize database
 @st.cache_resource
@@ -321,7 +321,7 @@ with stat_col3:
     
     # Count reports by location
     location_counts = {}
-    for report in db.get_all_reports(limit=500):
+    for report in db.get_all_reports(limit=500, columns=('location_name',)):
         loc = report['location_name']
         location_counts[loc] = location_counts.get(loc, 0) + 1
     
@@ -340,3 +340,6 @@ with stat_col3:
 # Footer
 st.markdown("---")
 st.info("💡 **Citizen Science Works!** Your observations help authorities respond faster and save lives. Thank you for being an Aqua Guardian!")
+
+# Non-critical styles, sent after the page content
+inject_deferred_css()
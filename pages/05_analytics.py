@@ -16,7 +16,7 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from src.lidar_loader import load_combined_tiles
-from src.ui_components import get_common_css, page_header, section_header
+from src.ui_components import inject_critical_css, inject_deferred_css, page_header, section_header
 
 st.set_page_config(
     page_title="Analytics - Aqua Guardians",
@@ -25,7 +25,7 @@ st.set_page_config(
 )
 
 # Apply common CSS
-st.markdown(get_common_css(), unsafe_allow_html=True)
+inject_critical_css()
 
 # Header
 page_header("📊", "Analytics Dashboard", "Data-Driven Insights for Flood Management")
@@ -425,3 +425,6 @@ with tab5:
 # Footer
 st.markdown("---")
 st.info("💡 **Analytics Dashboard** provides comprehensive data analysis tools for evidence-based flood management decisions!")
+
+# Non-critical styles, sent after the page content
+inject_deferred_css()
@@ -14,7 +14,7 @@ from datetime import datetime, timedelta
 sys.path.append(str(Path(__file__).parent.parent))
 
 from src.lidar_loader import load_combined_tiles
-from src.ui_components import get_common_css, page_header, section_header
+from src.ui_components import inject_critical_css, inject_deferred_css, page_header, section_header
 
 st.set_page_config(
     page_title="3D Terrain Viewer - Aqua Guardians",
@@ -23,7 +23,7 @@ st.set_page_config(
 )
 
 # Apply common CSS
-st.markdown(get_common_css(), unsafe_allow_html=True)
+inject_critical_css()
 
 # Header
 page_header("🗺️", "3D Interactive Terrain Viewer", "Real-Time Flood Simulation on Actual LiDAR Terrain")
@@ -119,10 +119,9 @@ with control_col4:
 # Generate 3D terrain
 st.markdown("---")
 
-# Create coordinate grids
+# Create coordinate axes (Surface broadcasts 1-D x/y over z, so no full meshgrid is needed)
 y_coords = np.arange(dem_data.shape[0])
 x_coords = np.arange(dem_data.shape[1])
-x_grid, y_grid = np.meshgrid(x_coords, y_coords)
 
 # Calculate flood mask (areas below water level + base elevation)
 base_elevation = np.nanpercentile(dem_data, 10)  # 10th percentile as base
@@ -150,8 +149,8 @@ else:
 # Create 3D surface plot
 fig = go.Figure(data=[go.Surface(
     z=dem_data,
-    x=x_grid,
-    y=y_grid,
+    x=x_coords,
+    y=y_coords,
     colorscale=use_colorscale,
     lighting=dict(
         ambient=0.4,
@@ -185,8 +184,8 @@ if show_flood_zone and water_level > 0:
     
     fig.add_trace(go.Surface(
         z=water_surface,
-        x=x_grid,
-        y=y_grid,
+        x=x_coords,
+        y=y_coords,
         colorscale=[[0, 'rgba(0, 119, 190, 0.5)'], [1, 'rgba(0, 180, 216, 0.5)']],
         showscale=False,
         name='Flood Water',
@@ -374,3 +373,6 @@ with insight_col2:
 # Footer
 st.markdown("---")
 st.info("🎮 **3D Terrain Viewer** provides photorealistic flood visualization using actual LiDAR elevation data. Rotate, zoom, and interact with the model!")
+
+# Non-critical styles, sent after the page content
+inject_deferred_css()
@@ -17,7 +17,7 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from src.ui_components import get_common_css, page_header, section_header
+from src.ui_components import inject_critical_css, inject_deferred_css, page_header, section_header
 
 st.set_page_config(
     page_title="Evacuation Optimizer - Aqua Guardians",
@@ -26,7 +26,7 @@ st.set_page_config(
 )
 
 # Apply common CSS
-st.markdown(get_common_css(), unsafe_allow_html=True)
+inject_critical_css()
 
 # Header
 page_header("🚨", "AI Evacuation Route Optimizer", "Machine Learning-Powered Emergency Route Planning")
@@ -416,3 +416,6 @@ else:
 # Footer
 st.markdown("---")
 st.info("🎯 **AI Evacuation Optimizer** uses machine learning + graph algorithms to calculate the safest, fastest route to high ground based on terrain, real-time traffic, and flood predictions!")
+
+# Non-critical styles, sent after the page content
+inject_deferred_css()
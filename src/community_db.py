@@ -6,9 +6,113 @@ SQLite backend for citizen flood observations
 import sqlite3
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Sequence
 import random
 import json
+from itertools import accumulate
+
+
+# Every column in the reports table, in schema order
+REPORT_COLUMNS = (
+    'id', 'timestamp', 'reporter_name', 'location_name', 'latitude',
+    'longitude', 'report_type', 'severity', 'description', 'water_level_cm',
+    'photo_url', 'verified', 'upvotes', 'created_at'
+)
+
+# Columns the portal map and report cards actually display
+SUMMARY_COLUMNS = (
+    'id', 'timestamp', 'reporter_name', 'location_name', 'latitude',
+    'longitude', 'report_type', 'severity', 'description', 'verified', 'upvotes'
+)
+
+
+# Demo data templates
+_DEMO_REPORT_TYPES = (
+    'Flooding', 'Rising Water', 'Blocked Drain', 'Erosion',
+    'Water Contamination', 'Infrastructure Damage', 'Wildlife Alert'
+)
+
+_DEMO_SEVERITIES = ('LOW', 'MODERATE', 'HIGH', 'CRITICAL')
+
+_DEMO_LOCATIONS = (
+    {'name': 'Haridwar Ghat', 'lat': 29.9457, 'lon': 78.1642},
+    {'name': 'Rishikesh Bridge', 'lat': 30.0869, 'lon': 78.2676},
+    {'name': 'Devprayag Confluence', 'lat': 30.1461, 'lon': 78.5989},
+    {'name': 'Uttarkashi Town', 'lat': 30.7268, 'lon': 78.4354},
+    {'name': 'Gangotri Temple', 'lat': 30.9993, 'lon': 78.9408},
+    {'name': 'Tehri Dam Area', 'lat': 30.3753, 'lon': 78.4809},
+    {'name': 'Kanpur Riverbank', 'lat': 26.4499, 'lon': 80.3319},
+    {'name': 'Allahabad Sangam', 'lat': 25.4358, 'lon': 81.8463},
+    {'name': 'Varanasi Ghats', 'lat': 25.3176, 'lon': 82.9739},
+    {'name': 'Patna Riverside', 'lat': 25.5941, 'lon': 85.1376}
+)
+
+_DEMO_DESCRIPTIONS = {
+    'Flooding': (
+        'Water level rising rapidly in residential area',
+        'Streets flooded, vehicles stuck',
+        'Low-lying areas completely submerged',
+        'Flash flood from upstream'
+    ),
+    'Rising Water': (
+        'River level increasing steadily',
+        'Water approaching danger mark',
+        'Overflow from canal observed',
+        'Tributaries swelling after rainfall'
+    ),
+    'Blocked Drain': (
+        'Drainage system clogged with debris',
+        'Manhole overflowing on main road',
+        'Waterlogging due to blocked outlet',
+        'Need urgent drain cleaning'
+    ),
+    'Erosion': (
+        'Riverbank erosion threatening homes',
+        'Soil collapse near embankment',
+        'Agricultural land being washed away',
+        'Retaining wall damaged'
+    ),
+    'Water Contamination': (
+        'Unusual color in river water',
+        'Dead fish observed downstream',
+        'Foul smell from water body',
+        'Suspected sewage mixing'
+    ),
+    'Infrastructure Damage': (
+        'Bridge support pillar cracked',
+        'Road washed away by current',
+        'Embankment breach detected',
+        'Flood protection wall damaged'
+    ),
+    'Wildlife Alert': (
+        'Crocodile spotted near village',
+        'Birds abandoning nesting area',
+        'Unusual animal behavior observed',
+        'Fish migration pattern changed'
+    )
+}
+
+_DEMO_REPORTER_NAMES = (
+    'Rajesh Kumar', 'Priya Sharma', 'Amit Singh', 'Neha Verma',
+    'Rahul Gupta', 'Pooja Patel', 'Vikram Mehta', 'Anjali Rao',
+    'Suresh Reddy', 'Kavita Desai', 'Manoj Joshi', 'Ritu Agarwal',
+    'Deepak Yadav', 'Sunita Nair', 'Arjun Malhotra', 'Geeta Iyer'
+)
+
+# Report age in hours over the last 7 days (more recent = higher probability)
+_DEMO_HOURS = range(0, 168)
+_DEMO_HOUR_CUM_WEIGHTS = tuple(accumulate(100 - (h // 2) for h in _DEMO_HOURS))
+
+# Severity distribution (more LOW/MODERATE than CRITICAL)
+_DEMO_SEVERITY_CUM_WEIGHTS = tuple(accumulate((40, 35, 20, 5)))
+
+
+def _select_list(columns: Sequence[str]) -> str:
+    """Build a validated SELECT column list (names cannot be bound as parameters)"""
+    unknown = [c for c in columns if c not in REPORT_COLUMNS]
+    if unknown or not columns:
+        raise ValueError(f"Unknown report columns: {unknown or columns}")
+    return ', '.join(columns)
 
 
 class CommunityDatabase:
@@ -26,9 +130,15 @@ class CommunityDatabase:
         # Initialize database
         self._init_database()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection whose rows support access by column name"""
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+    
     def _init_database(self):
         """Create tables if they don't exist"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -72,7 +182,7 @@ class CommunityDatabase:
         --------
         report_id : int
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
@@ -93,62 +203,71 @@ class CommunityDatabase:
         
         return report_id
     
-    def get_all_reports(self, limit: int = 100) -> List[Dict]:
-        """Get all reports (most recent first)"""
-        conn = sqlite3.connect(self.db_path)
+    def get_all_reports(
+        self,
+        limit: int = 100,
+        columns: Sequence[str] = SUMMARY_COLUMNS
+    ) -> List[sqlite3.Row]:
+        """Get all reports (most recent first), projecting only `columns`"""
+        conn = self._connect()
         cursor = conn.cursor()
         
-        cursor.execute('''
-            SELECT * FROM reports
+        cursor.execute(f'''
+            SELECT {_select_list(columns)} FROM reports
             ORDER BY timestamp DESC
             LIMIT ?
         ''', (limit,))
         
-        columns = [desc[0] for desc in cursor.description]
-        reports = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        reports = cursor.fetchall()
         
         conn.close()
         return reports
     
-    def get_recent_reports(self, hours: int = 24) -> List[Dict]:
-        """Get reports from last N hours"""
-        conn = sqlite3.connect(self.db_path)
+    def get_recent_reports(
+        self,
+        hours: int = 24,
+        columns: Sequence[str] = SUMMARY_COLUMNS
+    ) -> List[sqlite3.Row]:
+        """Get reports from last N hours, projecting only `columns`"""
+        conn = self._connect()
         cursor = conn.cursor()
         
         cutoff_time = (datetime.now() - timedelta(hours=hours)).strftime('%Y-%m-%d %H:%M:%S')
         
-        cursor.execute('''
-            SELECT * FROM reports
+        cursor.execute(f'''
+            SELECT {_select_list(columns)} FROM reports
             WHERE timestamp >= ?
             ORDER BY timestamp DESC
         ''', (cutoff_time,))
         
-        columns = [desc[0] for desc in cursor.description]
-        reports = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        reports = cursor.fetchall()
         
         conn.close()
         return reports
     
-    def get_reports_by_severity(self, severity: str) -> List[Dict]:
-        """Get reports filtered by severity"""
-        conn = sqlite3.connect(self.db_path)
+    def get_reports_by_severity(
+        self,
+        severity: str,
+        columns: Sequence[str] = SUMMARY_COLUMNS
+    ) -> List[sqlite3.Row]:
+        """Get reports filtered by severity, projecting only `columns`"""
+        conn = self._connect()
         cursor = conn.cursor()
         
-        cursor.execute('''
-            SELECT * FROM reports
+        cursor.execute(f'''
+            SELECT {_select_list(columns)} FROM reports
             WHERE severity = ?
             ORDER BY timestamp DESC
         ''', (severity,))
         
-        columns = [desc[0] for desc in cursor.description]
-        reports = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        reports = cursor.fetchall()
         
         conn.close()
         return reports
     
     def verify_report(self, report_id: int):
         """Mark a report as verified by authorities"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -162,7 +281,7 @@ class CommunityDatabase:
     
     def upvote_report(self, report_id: int):
         """Add an upvote to a report"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -176,7 +295,7 @@ class CommunityDatabase:
     
     def get_statistics(self) -> Dict:
         """Get database statistics"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         # Total reports
@@ -224,7 +343,7 @@ class CommunityDatabase:
         Populate database with demo data for hackathon presentation.
         Only runs if database is empty.
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         # Check if already populated
@@ -238,87 +357,24 @@ class CommunityDatabase:
         
         print(f"Populating database with {count} demo reports...")
         
-        # Demo data templates
-        report_types = [
-            'Flooding', 'Rising Water', 'Blocked Drain', 'Erosion',
-            'Water Contamination', 'Infrastructure Damage', 'Wildlife Alert'
-        ]
-        
-        severities = ['LOW', 'MODERATE', 'HIGH', 'CRITICAL']
-        
-        locations_ganga = [
-            {'name': 'Haridwar Ghat', 'lat': 29.9457, 'lon': 78.1642},
-            {'name': 'Rishikesh Bridge', 'lat': 30.0869, 'lon': 78.2676},
-            {'name': 'Devprayag Confluence', 'lat': 30.1461, 'lon': 78.5989},
-            {'name': 'Uttarkashi Town', 'lat': 30.7268, 'lon': 78.4354},
-            {'name': 'Gangotri Temple', 'lat': 30.9993, 'lon': 78.9408},
-            {'name': 'Tehri Dam Area', 'lat': 30.3753, 'lon': 78.4809},
-            {'name': 'Kanpur Riverbank', 'lat': 26.4499, 'lon': 80.3319},
-            {'name': 'Allahabad Sangam', 'lat': 25.4358, 'lon': 81.8463},
-            {'name': 'Varanasi Ghats', 'lat': 25.3176, 'lon': 82.9739},
-            {'name': 'Patna Riverside', 'lat': 25.5941, 'lon': 85.1376}
-        ]
-        
-        descriptions_templates = {
-            'Flooding': [
-                'Water level rising rapidly in residential area',
-                'Streets flooded, vehicles stuck',
-                'Low-lying areas completely submerged',
-                'Flash flood from upstream'
-            ],
-            'Rising Water': [
-                'River level increasing steadily',
-                'Water approaching danger mark',
-                'Overflow from canal observed',
-                'Tributaries swelling after rainfall'
-            ],
-            'Blocked Drain': [
-                'Drainage system clogged with debris',
-                'Manhole overflowing on main road',
-                'Waterlogging due to blocked outlet',
-                'Need urgent drain cleaning'
-            ],
-            'Erosion': [
-                'Riverbank erosion threatening homes',
-                'Soil collapse near embankment',
-                'Agricultural land being washed away',
-                'Retaining wall damaged'
-            ],
-            'Water Contamination': [
-                'Unusual color in river water',
-                'Dead fish observed downstream',
-                'Foul smell from water body',
-                'Suspected sewage mixing'
-            ],
-            'Infrastructure Damage': [
-                'Bridge support pillar cracked',
-                'Road washed away by current',
-                'Embankment breach detected',
-                'Flood protection wall damaged'
-            ],
-            'Wildlife Alert': [
-                'Crocodile spotted near village',
-                'Birds abandoning nesting area',
-                'Unusual animal behavior observed',
-                'Fish migration pattern changed'
-            ]
-        }
-        
-        reporter_names = [
-            'Rajesh Kumar', 'Priya Sharma', 'Amit Singh', 'Neha Verma',
-            'Rahul Gupta', 'Pooja Patel', 'Vikram Mehta', 'Anjali Rao',
-            'Suresh Reddy', 'Kavita Desai', 'Manoj Joshi', 'Ritu Agarwal',
-            'Deepak Yadav', 'Sunita Nair', 'Arjun Malhotra', 'Geeta Iyer'
-        ]
+        # Bind module constants locally for the generation loop
+        report_types = _DEMO_REPORT_TYPES
+        severities = _DEMO_SEVERITIES
+        locations_ganga = _DEMO_LOCATIONS
+        descriptions_templates = _DEMO_DESCRIPTIONS
+        reporter_names = _DEMO_REPORTER_NAMES
+        hours_range = _DEMO_HOURS
+        hour_cum_weights = _DEMO_HOUR_CUM_WEIGHTS
+        severity_cum_weights = _DEMO_SEVERITY_CUM_WEIGHTS
         
         # Generate reports over last 7 days
         base_time = datetime.now()
         
         for i in range(count):
-            # Random time in last 7 days (more recent = higher probability)
+            # Random time in last 7 days, weighted towards recent hours
             hours_ago = random.choices(
-                range(0, 168),  # 7 days = 168 hours
-                weights=[100 - (h // 2) for h in range(168)],  # Higher weight for recent
+                hours_range,
+                cum_weights=hour_cum_weights,
                 k=1
             )[0]
             
@@ -336,7 +392,7 @@ class CommunityDatabase:
             # Severity distribution (more LOW/MODERATE than CRITICAL)
             severity = random.choices(
                 severities,
-                weights=[40, 35, 20, 5],
+                cum_weights=severity_cum_weights,
                 k=1
             )[0]
             
@@ -4,18 +4,45 @@ Handles reading and validating LiDAR datasets
 """
 
 import os
+import logging
 import rasterio
+from rasterio.enums import Resampling
+from rasterio.windows import Window
 import numpy as np
 from pathlib import Path
 import json
+from xml.sax.saxutils import escape
 import re
-from typing import Tuple, Dict, List
+from typing import Tuple, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cached_property
+from itertools import repeat
 
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_RAW = PROJECT_ROOT / 'data' / 'raw'
 DATA_PROCESSED = PROJECT_ROOT / 'data' / 'processed'
 
+logger = logging.getLogger(__name__)
+
+# Tile IDs are the 7-digit run in a filename, e.g. 'EGM-NMCG_2063195.tif'
+_TILE_RE = re.compile(r'\d{7}')
+
+# Tile reads are I/O + decode bound; more threads than this just contend for disk
+LOAD_WORKERS = min(8, os.cpu_count() or 1)
+
+# GDAL settings for pixel reads: a 1 GB block cache and a 256 MB file cache so
+# re-reading a tile (preview then full read) hits memory, and no sibling-file
+# directory listing on every open
+GDAL_ENV_OPTIONS = {
+    'GDAL_CACHEMAX': 1024 * 1024 * 1024,  # bytes; rasterio requires an int here
+    'VSI_CACHE': 'TRUE',
+    'VSI_CACHE_SIZE': '268435456',
+    'GDAL_DISABLE_READDIR_ON_OPEN': 'EMPTY_DIR',
+    'CPL_VSIL_CURL_USE_HEAD': 'NO',
+    'CPL_VSIL_CURL_ALLOWED_EXTENSIONS': '.tif',
+}
+
 
 class LiDARDataset:
     """Manages LiDAR DEM and ORTHO image pairs"""
@@ -32,14 +59,118 @@ class LiDARDataset:
         self.enable_ortho = load_ortho  # Renamed to avoid conflict with method name
         self.dem_dir = DATA_RAW / zone_name / 'DEM'
         self.ortho_dir = DATA_RAW / zone_name / 'ORTHO'
+        manifest_name = f'{zone_name}_manifest.json' if load_ortho else f'{zone_name}_dem_manifest.json'
+        self.manifest_path = DATA_PROCESSED / manifest_name
+        self._tile_ids: Dict[Path, str] = {}
         
-        # Scan available files
-        self.dem_files = self._scan_tif_files(self.dem_dir)
-        self.ortho_files = self._scan_tif_files(self.ortho_dir) if load_ortho else []
-        
-        # Find matched pairs only (or just DEM files in DEM-only mode)
-        self.matched_pairs = self._find_all_matched_pairs()
+        # Reuse the cached scan if the tile folders have not changed since it was written
+        self._manifest = self._load_manifest()
         
+        # Scan available files (ORTHO files and matched pairs are resolved lazily)
+        if self._manifest:
+            self.dem_files = [self.dem_dir / p for p in self._manifest['dem_files']]
+        else:
+            self.dem_files = self._scan_tif_files(self.dem_dir)
+    
+    @cached_property
+    def ortho_files(self) -> List[Path]:
+        """ORTHO files, scanned on first access (always empty in DEM-only mode)"""
+        if self._manifest:
+            return [self.ortho_dir / p for p in self._manifest['ortho_files']]
+        return self._scan_tif_files(self.ortho_dir) if self.enable_ortho else []
+    
+    @cached_property
+    def matched_pairs(self) -> List[Tuple[Path, Path]]:
+        """Matched pairs only (or just DEM files in DEM-only mode), resolved on first access"""
+        if self._manifest:
+            # Reuse the Path objects already built for the file lists
+            dem_paths = dict(zip(self._manifest['dem_files'], self.dem_files))
+            ortho_paths = dict(zip(self._manifest['ortho_files'], self.ortho_files))
+            return [
+                (dem_paths[dem], ortho_paths[ortho] if ortho else None)
+                for dem, ortho in self._manifest['pairs']
+            ]
+        matched_pairs = self._find_all_matched_pairs()
+        self._save_manifest(matched_pairs)
+        return matched_pairs
+    
+    def _scan_signature(self, dem_files: List[str], ortho_files: List[str]) -> Dict:
+        """
+        Modification times of the tile folders, of each folder the manifest lists
+        tiles in, and of the folders in between, keyed by path relative to the
+        tile folder. Stat calls only: nothing is listed, so checking stays cheap
+        on large trees. Adding or removing a tile or subfolder along those paths
+        changes one of the mtimes; tiles dropped into a pre-existing folder that
+        held none are not noticed (delete the manifest to force a rescan).
+        """
+        def dir_mtimes(directory: Path, files: List[str]):
+            if not directory.exists():
+                return None
+            folders = {''}
+            for parent in {name.rpartition('/')[0] for name in files}:
+                while parent not in folders:
+                    folders.add(parent)
+                    parent = parent.rpartition('/')[0]
+            mtimes = {}
+            for folder in sorted(folders):
+                try:
+                    mtimes[folder] = os.stat(os.path.join(directory, folder)).st_mtime_ns
+                except FileNotFoundError:
+                    mtimes[folder] = None
+            return mtimes
+        
+        return {
+            'dem': dir_mtimes(self.dem_dir, dem_files),
+            'ortho': dir_mtimes(self.ortho_dir, ortho_files) if self.enable_ortho else None
+        }
+    
+    def _load_manifest(self) -> Optional[Dict]:
+        """Read the cached scan; None if it is missing, unreadable or stale"""
+        try:
+            with open(self.manifest_path) as f:
+                manifest = json.load(f)
+            if not all(isinstance(manifest[k], list) for k in ('dem_files', 'ortho_files', 'pairs')):
+                return None
+            if (manifest['enable_ortho'] != self.enable_ortho
+                    or manifest['signature'] != self._scan_signature(manifest['dem_files'], manifest['ortho_files'])):
+                return None
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        
+        print(f"[OK] Loaded {len(manifest['pairs'])} tile pairs from {self.manifest_path.name}")
+        return manifest
+    
+    def _save_manifest(self, matched_pairs: List[Tuple[Path, Path]]):
+        """Persist the scan so the next start can skip walking the tile folders"""
+        # Paths are stored relative to the tile folders so the project can be moved
+        dem_files = self._relative_names(self.dem_files, self.dem_dir)
+        ortho_files = self._relative_names(self.ortho_files, self.ortho_dir)
+        dem_names = dict(zip(self.dem_files, dem_files))
+        ortho_names = dict(zip(self.ortho_files, ortho_files))
+        manifest = {
+            'enable_ortho': self.enable_ortho,
+            'signature': self._scan_signature(dem_files, ortho_files),
+            'dem_files': dem_files,
+            'ortho_files': ortho_files,
+            'pairs': [(dem_names[dem], ortho_names[ortho] if ortho else None) for dem, ortho in matched_pairs]
+        }
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.manifest_path, 'w') as f:
+                json.dump(manifest, f)
+        except OSError as e:
+            print(f"WARNING Could not write manifest {self.manifest_path}: {e}")
+    
+    @staticmethod
+    def _relative_names(paths: List[Path], directory: Path) -> List[str]:
+        """
+        Manifest form of scanned tile paths: POSIX-style and relative to their tile folder.
+        Every path comes from os.walk(directory), so stripping the prefix is enough
+        (and much cheaper than Path.relative_to on large tile sets).
+        """
+        prefix = len(os.path.join(directory, ''))
+        return [os.fspath(p)[prefix:].replace(os.sep, '/') for p in paths]
+    
     def _scan_tif_files(self, directory: Path) -> List[Path]:
         """Recursively find all .tif files in directory and subdirectories"""
         if not directory.exists():
@@ -47,11 +178,15 @@ class LiDARDataset:
             return []
         
         # Recursively find all .tif files (including in subdirectories)
-        tif_files = list(directory.rglob('*.tif'))
-        # Filter out .ovr files (overviews) and geodatabase files
-        tif_files = [f for f in tif_files if not f.name.endswith('.ovr') 
-                     and '.gdb' not in str(f) 
-                     and '.Overviews' not in str(f)]
+        tif_files = []
+        for root, dirs, files in os.walk(directory):
+            # Prune geodatabase and overview folders so os.walk never descends into them
+            dirs[:] = [d for d in dirs if '.gdb' not in d and '.Overviews' not in d]
+            for name in files:
+                # Filter out .ovr files (overviews) and geodatabase files
+                if (name.endswith('.tif') and not name.endswith('.ovr')
+                        and '.gdb' not in name and '.Overviews' not in name):
+                    tif_files.append(Path(root) / name)
         print(f"OK Found {len(tif_files)} .tif files in {directory.name} (recursive)")
         return sorted(tif_files)
     
@@ -64,9 +199,15 @@ class LiDARDataset:
         - 'EGM-NMCG-7923199.tif' -> '7923199'
         """
         # Extract 7-digit number from filename
-        match = re.search(r'\d{7}', filename)
+        match = _TILE_RE.search(filename)
         return match.group(0) if match else None
     
+    def _tile_id(self, path: Path) -> str:
+        """Tile ID for a scanned file, parsed once and cached per path"""
+        if path not in self._tile_ids:
+            self._tile_ids[path] = self._extract_tile_id(path.name)
+        return self._tile_ids[path]
+    
     def _find_all_matched_pairs(self) -> List[Tuple[Path, Path]]:
         """
         Find all DEM files that have matching ORTHO files.
@@ -75,31 +216,25 @@ class LiDARDataset:
         - DEM: EGM-NMCG_*.tif, EGM-NHP_*.tif, EGM-NMCG-*.tif
         - ORTHO: NMCG_*.tif, NHP_*.tif
         """
-        matched = []
-        
         # DEM-only mode: return all DEM files with None for ORTHO
         if not self.enable_ortho:
-            for dem_file in self.dem_files:
-                matched.append((dem_file, None))
+            matched = list(zip(self.dem_files, repeat(None)))
             print(f"[OK] Found {len(matched)} DEM files (DEM-only mode)")
             return matched
         
         # Normal mode: Build a map of tile_id -> ortho_path for fast lookup
-        ortho_map = {}
-        for ortho_file in self.ortho_files:
-            tile_id = self._extract_tile_id(ortho_file.name)
-            if tile_id:
-                ortho_map[tile_id] = ortho_file
+        ortho_map = {
+            tile_id: ortho_file
+            for ortho_file in self.ortho_files
+            if (tile_id := self._tile_id(ortho_file))
+        }
         
-        # Match DEM files with ORTHO files
-        for dem_file in self.dem_files:
-            tile_id = self._extract_tile_id(dem_file.name)
-            if not tile_id:
-                continue
-            
-            # Check if we have a matching ORTHO file
-            if tile_id in ortho_map:
-                matched.append((dem_file, ortho_map[tile_id]))
+        # Match DEM files with ORTHO files (files without a tile ID never match)
+        matched = [
+            (dem_file, ortho_map[tile_id])
+            for dem_file in self.dem_files
+            if (tile_id := self._tile_id(dem_file)) in ortho_map
+        ]
         
         print(f"[OK] Found {len(matched)} matched DEM-ORTHO pairs")
         return matched
@@ -146,25 +281,131 @@ class LiDARDataset:
         """Get all matched DEM-ORTHO pairs"""
         return self.matched_pairs
     
-    def load_combined_tiles(self) -> Tuple[np.ndarray, np.ndarray, Dict]:
+    def load_combined_tiles(self, max_workers: int = None) -> Tuple[np.ndarray, np.ndarray, Dict]:
         """
         Load and combine all matched tile pairs into a geographic mosaic.
         Arranges tiles side-by-side based on their geographic positions.
         
+        Args:
+            max_workers: Threads used to read tiles (defaults to LOAD_WORKERS)
+        
         Returns:
-            Tuple of (combined_dem, combined_rgb, metadata)
+            Tuple of (combined_dem, combined_rgb, metadata); combined_rgb is uint8 RGBA
+            (height, width, 4) with alpha 0 in padding and 255 over tiles
         """
         if len(self.matched_pairs) == 0:
             raise ValueError("No matched pairs available to combine")
         
         print(f"\n[INFO] Combining {len(self.matched_pairs)} tiles into geographic mosaic...")
         
+        layout = self._mosaic_layout()
+        tiles_by_position = layout['tiles_by_position']
+        rows, cols, slots = layout['rows'], layout['cols'], layout['slots']
+        max_tile_height, max_tile_width = layout['tile_shape']
+        max_row_tiles = layout['max_row_tiles']
+        
+        # Pre-allocate the mosaic; unfilled (padding) pixels stay NaN / black
+        mosaic_height = len(rows) * max_tile_height
+        mosaic_width = max_row_tiles * max_tile_width
+        combined_dem = np.full((mosaic_height, mosaic_width), np.float32(np.nan), dtype=np.float32)
+        combined_rgb = np.zeros((mosaic_height, mosaic_width, 4), dtype=np.uint8)
+        
+        def load_and_place(pos):
+            dem_path, ortho_path, _ = tiles_by_position[pos]
+            dem, rgb = self._load_tile(dem_path, ortho_path)
+            row_idx, slot_idx = slots[pos]
+            y0 = row_idx * max_tile_height
+            x0 = slot_idx * max_tile_width
+            combined_dem[y0:y0 + dem.shape[0], x0:x0 + dem.shape[1]] = dem
+            combined_rgb[y0:y0 + rgb.shape[0], x0:x0 + rgb.shape[1]] = rgb
+        
+        # Second pass: load tiles in parallel and copy each into its slot on the
+        # same worker. rasterio and NumPy slice copies both release the GIL, each
+        # worker opens its own handle, and slots never overlap, so no locking is needed.
+        with ThreadPoolExecutor(max_workers=max_workers or LOAD_WORKERS) as executor:
+            futures = [executor.submit(load_and_place, pos) for pos in tiles_by_position]
+            for future in as_completed(futures):
+                future.result()  # re-raise any worker error
+        
+        metadata = {
+            'num_tiles': len(tiles_by_position),
+            'grid_layout': f"{len(rows)} rows x {len(cols)} columns",
+            'combined_shape': combined_dem.shape,
+            'tiles': sorted([tid for _, _, tid in tiles_by_position.values()])
+        }
+        
+        print(f"[OK] Geographic mosaic created: {combined_dem.shape}")
+        print(f"  Elevation range: {np.nanmin(combined_dem):.2f}m to {np.nanmax(combined_dem):.2f}m")
+        
+        return combined_dem, combined_rgb, metadata
+    
+    def load_combined_tiles_lazy(self):
+        """
+        Build the DEM mosaic as a lazy dask array with the same layout as load_combined_tiles.
+        Nothing is read until a result is computed, each tile is one chunk, and reductions
+        stream tile by tile on dask's thread pool, so the mosaic never has to fit in RAM.
+        Call .compute() only on final results, e.g. combined_dem.max().compute()
+        (dask.array.nanmax for NaN-aware reductions).
+        
+        Requires the optional dask[array] package.
+        
+        Returns:
+            Tuple of (lazy float32 combined_dem, metadata)
+        """
+        import dask
+        import dask.array as da
+        
+        if len(self.matched_pairs) == 0:
+            raise ValueError("No matched pairs available to combine")
+        
+        layout = self._mosaic_layout()
+        tiles_by_position = layout['tiles_by_position']
+        rows, cols = layout['rows'], layout['cols']
+        tile_shape = layout['tile_shape']
+        
+        # Padding slots are constant NaN chunks; the rest are deferred reads
+        grid = [
+            [da.full(tile_shape, np.nan, dtype=np.float32) for _ in range(layout['max_row_tiles'])]
+            for _ in rows
+        ]
+        for pos, (dem_path, _, _) in tiles_by_position.items():
+            row_idx, slot_idx = layout['slots'][pos]
+            tile = dask.delayed(self._load_padded_dem)(dem_path, tile_shape)
+            grid[row_idx][slot_idx] = da.from_delayed(tile, shape=tile_shape, dtype=np.float32)
+        
+        combined_dem = da.block(grid)
+        metadata = {
+            'num_tiles': len(tiles_by_position),
+            'grid_layout': f"{len(rows)} rows x {len(cols)} columns",
+            'combined_shape': combined_dem.shape,
+            'tiles': sorted([tid for _, _, tid in tiles_by_position.values()])
+        }
+        
+        print(f"[OK] Lazy geographic mosaic prepared: {combined_dem.shape}")
+        return combined_dem, metadata
+    
+    def _load_padded_dem(self, dem_path: Path, tile_shape: Tuple[int, int]) -> np.ndarray:
+        """Load one DEM tile NaN-padded to tile_shape (a chunk of load_combined_tiles_lazy)"""
+        dem, _ = self.load_dem(dem_path)
+        padded = np.full(tile_shape, np.float32(np.nan), dtype=np.float32)
+        padded[:dem.shape[0], :dem.shape[1]] = dem
+        return padded
+    
+    def _mosaic_layout(self) -> Dict:
+        """
+        Work out where each matched tile goes in the combined mosaic.
+        Reads tile headers only; shared by load_combined_tiles and load_combined_tiles_lazy.
+        
+        Returns:
+            Dict with tiles_by_position, rows, cols, slots ((row, col) -> (row_idx, slot_idx)),
+            tile_shape (padded tile size) and max_row_tiles
+        """
         # Parse tile IDs and organize by grid position
         # Tile ID format: RRRCCCCC (3-digit row + 4-digit column)
         tiles_by_position = {}
         
         for dem_path, ortho_path in self.matched_pairs:
-            tile_id = self._extract_tile_id(dem_path.name)
+            tile_id = self._tile_id(dem_path)
             if tile_id:
                 row = int(tile_id[:3])  # First 3 digits = row
                 col = int(tile_id[3:])  # Last 4 digits = column
@@ -176,113 +417,203 @@ class LiDARDataset:
         
         print(f"  Grid layout: {len(rows)} rows x {len(cols)} columns")
         
-        # Create grid of tiles (row by row)
-        grid_dem = []
-        grid_rgb = []
-        
-        # First pass: find max dimensions for padding
+        # First pass: find max dimensions for padding (header only, no pixel reads)
         max_tile_height = 0
         max_tile_width = 0
         
         for dem_path, ortho_path, _ in tiles_by_position.values():
-            dem, _ = self.load_dem(dem_path)
-            max_tile_height = max(max_tile_height, dem.shape[0])
-            max_tile_width = max(max_tile_width, dem.shape[1])
+            with rasterio.open(dem_path) as src:
+                max_tile_height = max(max_tile_height, src.height)
+                max_tile_width = max(max_tile_width, src.width)
         
         print(f"  Standard tile size: {max_tile_height} x {max_tile_width}")
         
-        # Second pass: load and pad tiles to standard size
+        # Each row packs its tiles left to right, so a tile's slot is its
+        # index among the tiles present in that row
+        slots = {}
         for row_idx, row in enumerate(rows):
-            print(f"  Processing row {row_idx+1}/{len(rows)} (row {row})...")
-            row_dem_tiles = []
-            row_rgb_tiles = []
-            
-            for col in cols:
-                if (row, col) in tiles_by_position:
-                    dem_path, ortho_path, tile_id = tiles_by_position[(row, col)]
-                    print(f"    Loading tile {tile_id}...")
-                    dem, _ = self.load_dem(dem_path)
-                    
-                    # Load RGB if available, otherwise create grayscale
-                    if ortho_path and self.enable_ortho:
-                        rgb = self.load_ortho(ortho_path, target_shape=dem.shape)
-                    else:
-                        # Create grayscale heightmap
-                        normalized = ((dem - np.nanmin(dem)) / (np.nanmax(dem) - np.nanmin(dem)) * 255).astype(np.uint8)
-                        rgb = np.stack([normalized, normalized, normalized], axis=-1)
-                    
-                    # Pad to standard size if needed
-                    if dem.shape[0] < max_tile_height or dem.shape[1] < max_tile_width:
-                        pad_height = max_tile_height - dem.shape[0]
-                        pad_width = max_tile_width - dem.shape[1]
-                        dem = np.pad(dem, ((0, pad_height), (0, pad_width)), constant_values=np.nan)
-                        rgb = np.pad(rgb, ((0, pad_height), (0, pad_width), (0, 0)), constant_values=0)
-                    
-                    row_dem_tiles.append(dem)
-                    row_rgb_tiles.append(rgb)
-            
-            if row_dem_tiles:
-                # Concatenate tiles horizontally (side by side)
-                row_dem = np.hstack(row_dem_tiles)
-                row_rgb = np.hstack(row_rgb_tiles)
-                grid_dem.append(row_dem)
-                grid_rgb.append(row_rgb)
-        
-        # Pad rows to same width before stacking
-        max_row_width = max(row.shape[1] for row in grid_dem)
-        
-        for i in range(len(grid_dem)):
-            if grid_dem[i].shape[1] < max_row_width:
-                pad_width = max_row_width - grid_dem[i].shape[1]
-                grid_dem[i] = np.pad(grid_dem[i], ((0, 0), (0, pad_width)), constant_values=np.nan)
-                grid_rgb[i] = np.pad(grid_rgb[i], ((0, 0), (0, pad_width), (0, 0)), constant_values=0)
-        
-        # Stack rows vertically
-        print("  Assembling final mosaic...")
-        combined_dem = np.vstack(grid_dem)
-        combined_rgb = np.vstack(grid_rgb)
-        
-        metadata = {
-            'num_tiles': len(tiles_by_position),
-            'grid_layout': f"{len(rows)} rows x {len(cols)} columns",
-            'combined_shape': combined_dem.shape,
-            'tiles': sorted([tid for _, _, tid in tiles_by_position.values()])
+            row_cols = [col for col in cols if (row, col) in tiles_by_position]
+            for slot_idx, col in enumerate(row_cols):
+                slots[(row, col)] = (row_idx, slot_idx)
+        max_row_tiles = max(slot_idx for _, slot_idx in slots.values()) + 1
+        
+        
+        return {
+            'tiles_by_position': tiles_by_position,
+            'rows': rows,
+            'cols': cols,
+            'slots': slots,
+            'tile_shape': (max_tile_height, max_tile_width),
+            'max_row_tiles': max_row_tiles
         }
+    
+    def _load_tile(self, dem_path: Path, ortho_path: Path) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Load one DEM tile and its RGB (ORTHO or grayscale heightmap).
+        Runs on a worker thread from load_combined_tiles.
+        """
+        logger.debug("Loading tile %s", self._tile_id(dem_path))
+        dem, _ = self.load_dem(dem_path)
         
-        print(f"[OK] Geographic mosaic created: {combined_dem.shape}")
-        print(f"  Elevation range: {np.nanmin(combined_dem):.2f}m to {np.nanmax(combined_dem):.2f}m")
+        # Load RGB if available, otherwise create grayscale
+        if ortho_path and self.enable_ortho:
+            rgb = self.load_ortho(ortho_path, target_shape=dem.shape)
+        else:
+            # Create grayscale heightmap
+            normalized = ((dem - np.nanmin(dem)) / (np.nanmax(dem) - np.nanmin(dem)) * 255).astype(np.uint8)
+            rgb = np.empty((*dem.shape, 4), dtype=np.uint8)
+            rgb[..., :3] = normalized[..., np.newaxis]
+            rgb[..., 3] = 255
         
-        return combined_dem, combined_rgb, metadata
+        return dem, rgb
     
-    def load_dem(self, filepath: Path) -> Tuple[np.ndarray, Dict]:
+    def load_dem(self, filepath: Path, overview_level: int = None) -> Tuple[np.ndarray, Dict]:
         """
         Load Digital Elevation Model
         
+        Args:
+            filepath: Path to DEM .tif file
+            overview_level: If provided, read a preview decimated by 2**overview_level
+                per axis (served from the file's internal overviews when present)
+        
         Returns:
-            Tuple of (elevation_array, metadata_dict)
+            Tuple of (float32 elevation_array with NaN for invalid cells, metadata_dict)
         """
-        with rasterio.open(filepath) as src:
-            dem = src.read(1)  # Read first band
+        with rasterio.Env(**GDAL_ENV_OPTIONS), rasterio.open(filepath) as src:
+            if overview_level:
+                out_shape = (max(1, src.height >> overview_level), max(1, src.width >> overview_level))
+                dem = src.read(1, out_shape=out_shape, resampling=Resampling.average, out_dtype='float32')
+                transform = src.transform * src.transform.scale(
+                    src.width / out_shape[1], src.height / out_shape[0]
+                )
+            else:
+                dem = src.read(1, out_dtype='float32')  # Read first band as float32
+                transform = src.transform
             
             metadata = {
                 'bounds': src.bounds,
                 'crs': src.crs.to_string() if src.crs else None,
-                'transform': src.transform,
-                'width': src.width,
-                'height': src.height,
-                'resolution': src.res,
+                'transform': transform,
+                'width': dem.shape[1],
+                'height': dem.shape[0],
+                'resolution': (abs(transform.a), abs(transform.e)),
                 'nodata': src.nodata
             }
             
-            # Clean nodata values
-            if metadata['nodata'] is not None:
-                dem = np.where(dem == metadata['nodata'], np.nan, dem)
-            
-            # Remove extreme outliers (likely errors)
-            dem = np.where(dem < -100, np.nan, dem)
-            dem = np.where(dem > 5000, np.nan, dem)
+            self._mask_invalid(dem, metadata['nodata'])
             
-        print(f"  Elevation range: {np.nanmin(dem):.2f}m to {np.nanmax(dem):.2f}m")
+        # Per-tile range costs two full-array reductions; only pay for it when debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Elevation range: %.2fm to %.2fm", np.nanmin(dem), np.nanmax(dem))
+        return dem, metadata
+    
+    @staticmethod
+    def _mask_invalid(dem: np.ndarray, nodata: Optional[float]):
+        """Set nodata and extreme outliers (likely errors) to NaN in place, in one pass"""
+        invalid = (dem < -100) | (dem > 5000)
+        if nodata is not None:
+            invalid |= (dem == nodata)
+        dem[invalid] = np.nan
+    
+    def build_vrt(self, out_path: Path = None) -> Path:
+        """
+        Write a GDAL VRT that mosaics every DEM tile by its georeferencing.
+        The VRT is only an XML index of the tiles; pixels are read from the
+        source files when a window of the mosaic is requested (see open_mosaic).
+        
+        Args:
+            out_path: Destination .vrt file (defaults to data/processed/<zone>_mosaic.vrt)
+        
+        Returns:
+            Path to the written VRT
+        """
+        if not self.dem_files:
+            raise ValueError("No DEM tiles available to build a mosaic")
+        
+        out_path = Path(out_path) if out_path else DATA_PROCESSED / f'{self.zone_name}_mosaic.vrt'
+        
+        # Header-only pass: footprint of every tile (CRS and pixel size from the first)
+        tiles = []
+        for dem_path in self.dem_files:
+            with rasterio.open(dem_path) as src:
+                tiles.append((dem_path, src.bounds, src.width, src.height, src.nodata))
+                if len(tiles) == 1:
+                    crs, (res_x, res_y) = src.crs, src.res
+        
+        left = min(b.left for _, b, _, _, _ in tiles)
+        right = max(b.right for _, b, _, _, _ in tiles)
+        bottom = min(b.bottom for _, b, _, _, _ in tiles)
+        top = max(b.top for _, b, _, _, _ in tiles)
+        width = int(round((right - left) / res_x))
+        height = int(round((top - bottom) / res_y))
+        
+        # Uncovered mosaic pixels read back as nodata and are masked by open_mosaic
+        nodata = next((nd for _, _, _, _, nd in tiles if nd is not None), -9999.0)
+        
+        sources = []
+        for dem_path, b, w, h, tile_nodata in tiles:
+            x_off = int(round((b.left - left) / res_x))
+            y_off = int(round((top - b.top) / res_y))
+            x_size = int(round((b.right - b.left) / res_x))
+            y_size = int(round((b.top - b.bottom) / res_y))
+            # Skip the tile's own nodata so it never overwrites a neighbour's overlap
+            source_nodata = f'      <NODATA>{tile_nodata!r}</NODATA>\n' if tile_nodata is not None else ''
+            sources.append(
+                '    <ComplexSource>\n'
+                f'      <SourceFilename relativeToVRT="0">{escape(str(Path(dem_path).resolve()))}</SourceFilename>\n'
+                '      <SourceBand>1</SourceBand>\n'
+                f'      <SrcRect xOff="0" yOff="0" xSize="{w}" ySize="{h}" />\n'
+                f'      <DstRect xOff="{x_off}" yOff="{y_off}" xSize="{x_size}" ySize="{y_size}" />\n'
+                f'{source_nodata}'
+                '    </ComplexSource>\n'
+            )
+        
+        srs = f'  <SRS>{escape(crs.to_wkt())}</SRS>\n' if crs else ''
+        vrt = (
+            f'<VRTDataset rasterXSize="{width}" rasterYSize="{height}">\n'
+            f'{srs}'
+            f'  <GeoTransform>{left!r}, {res_x!r}, 0.0, {top!r}, 0.0, {-res_y!r}</GeoTransform>\n'
+            '  <VRTRasterBand dataType="Float32" band="1">\n'
+            f'    <NoDataValue>{nodata!r}</NoDataValue>\n'
+            f'{"".join(sources)}'
+            '  </VRTRasterBand>\n'
+            '</VRTDataset>\n'
+        )
+        
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_path.write_text(vrt)
+        print(f"[OK] Virtual mosaic written: {out_path} ({len(tiles)} tiles, {height} x {width})")
+        return out_path
+    
+    def open_mosaic(self, window: Window = None, vrt_path: Path = None) -> Tuple[np.ndarray, Dict]:
+        """
+        Read a window of the virtual DEM mosaic without loading the other tiles.
+        Use this instead of load_combined_tiles when only part of the zone is needed.
+        
+        Args:
+            window: rasterio Window in mosaic pixel coordinates (None reads everything)
+            vrt_path: Existing VRT to read (built with build_vrt if missing)
+        
+        Returns:
+            Tuple of (float32 elevation_array with NaN for invalid cells, metadata_dict)
+        """
+        vrt_path = Path(vrt_path) if vrt_path else DATA_PROCESSED / f'{self.zone_name}_mosaic.vrt'
+        if not vrt_path.exists():
+            self.build_vrt(vrt_path)
+        
+        with rasterio.Env(**GDAL_ENV_OPTIONS), rasterio.open(vrt_path) as src:
+            dem = src.read(1, window=window, out_dtype='float32')
+            transform = src.window_transform(window) if window is not None else src.transform
+            metadata = {
+                'crs': src.crs.to_string() if src.crs else None,
+                'transform': transform,
+                'width': dem.shape[1],
+                'height': dem.shape[0],
+                'resolution': src.res,
+                'nodata': src.nodata
+            }
+            self._mask_invalid(dem, src.nodata)
+        
         return dem, metadata
     
     def load_ortho(self, filepath: Path, target_shape: Tuple[int, int] = None) -> np.ndarray:
@@ -294,29 +625,34 @@ class LiDARDataset:
             target_shape: If provided, resample to match this shape (height, width)
             
         Returns:
-            RGB array of shape (height, width, 3)
+            uint8 RGBA array of shape (height, width, 4), alpha 255. The 4-byte pixel
+            stride keeps rows aligned for vectorized downstream ops; use [..., :3] for RGB.
         """
-        with rasterio.open(filepath) as src:
+        with rasterio.Env(**GDAL_ENV_OPTIONS), rasterio.open(filepath) as src:
+            # Read all three bands in one call (one decode/resampling pass)
             if target_shape:
                 # Resample to match DEM size
-                from rasterio.enums import Resampling
-                r = src.read(1, out_shape=target_shape, resampling=Resampling.bilinear)
-                g = src.read(2, out_shape=target_shape, resampling=Resampling.bilinear)
-                b = src.read(3, out_shape=target_shape, resampling=Resampling.bilinear)
+                rgb_chw = src.read(
+                    indexes=[1, 2, 3],
+                    out_shape=(3, *target_shape),
+                    resampling=Resampling.bilinear
+                )
             else:
-                r = src.read(1)
-                g = src.read(2)
-                b = src.read(3)
-            
-            # Normalize to 8-bit if needed
-            if r.max() > 255:
-                r = (r / r.max() * 255).astype(np.uint8)
-                g = (g / g.max() * 255).astype(np.uint8)
-                b = (b / b.max() * 255).astype(np.uint8)
-            
-            rgb = np.stack([r, g, b], axis=-1)
+                rgb_chw = src.read(indexes=[1, 2, 3])
+        
+        # Normalize each band to 8-bit if needed: one max-scan per band, then a
+        # single float32 multiply (clipped so rounding at the band max cannot wrap)
+        if rgb_chw.dtype != np.uint8:
+            band_max = rgb_chw.reshape(3, -1).max(axis=1).astype(np.float32)
+            if band_max.max() > 255:
+                scale = (255.0 / np.maximum(band_max, 1)).reshape(3, 1, 1)
+                rgb_chw = (rgb_chw * scale).clip(0, 255).astype(np.uint8)
+        
+        rgb = np.empty((*rgb_chw.shape[1:], 4), dtype=np.uint8)
+        rgb[..., :3] = np.moveaxis(rgb_chw, 0, -1)
+        rgb[..., 3] = 255
         
-        print(f"  Loaded RGB image: {rgb.shape}")
+        logger.debug("Loaded RGB image: %s", rgb.shape)
         return rgb
     
     def get_dataset_summary(self) -> str:
@@ -332,7 +668,7 @@ class LiDARDataset:
         if len(self.matched_pairs) > 0:
             summary += "Available Matched Pairs:\n"
             for dem, ortho in self.matched_pairs[:5]:  # Show first 5
-                tile_id = self._extract_tile_id(dem.name)
+                tile_id = self._tile_id(dem)
                 summary += f"  * Tile {tile_id}: {dem.name} <-> {ortho.name}\n"
             if len(self.matched_pairs) > 5:
                 summary += f"  ... and {len(self.matched_pairs) - 5} more\n"
@@ -7,6 +7,105 @@ import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import Tuple, Dict, List
+from bisect import bisect_right
+from functools import lru_cache
+
+# Weighted importance of each component, in argument order
+_WEIGHTS = (
+    0.30,  # vegetation - Critical for soil stability and oxygen
+    0.35,  # water - Most critical for Ganga ecosystem
+    0.20,  # terrain - Important for flood prevention
+    0.15,  # biodiversity - Long-term health indicator
+)
+
+# Grade bands: a score >= _THRESHOLDS[i - 1] (and below _THRESHOLDS[i]) gets _GRADES[i]
+_THRESHOLDS = (40, 45, 50, 55, 60, 65, 70, 75, 80, 85, 90, 95)
+_GRADES = (
+    ("F", "Critical"),
+    ("D-", "Poor"), ("D", "Poor"), ("D+", "Poor"),
+    ("C-", "Moderate"), ("C", "Moderate"), ("C+", "Moderate"),
+    ("B-", "Good"), ("B", "Good"), ("B+", "Good"),
+    ("A-", "Excellent"), ("A", "Excellent"), ("A+", "Excellent"),
+)
+
+# Per-component insight bands: below 60 / 60-80 / 80 and above
+_FACTOR_BANDS = (60, 80)
+_FACTOR_INSIGHTS = (
+    ('vegetation', (
+        "🔴 Poor vegetation health - urgent restoration needed",
+        "⚠️ Moderate vegetation health - monitor for declining trends",
+        "✅ Excellent vegetation cover - ecosystem is thriving",
+    )),
+    ('water', (
+        "🔴 Critical pollution levels - immediate action required",
+        "⚠️ Moderate pollution - requires monitoring and intervention",
+        "✅ Clean water - safe for ecosystem and human use",
+    )),
+    ('terrain', (
+        "🔴 High erosion risk - structural interventions needed",
+        "⚠️ Some erosion detected - preventive measures recommended",
+        "✅ Stable riverbanks - low erosion risk",
+    )),
+    ('biodiversity', (
+        "🔴 Low biodiversity - ecosystem under stress",
+        "⚠️ Declining species diversity - habitat restoration suggested",
+        "✅ Rich biodiversity - healthy ecosystem indicators",
+    )),
+)
+
+# (component, score below which the recommendation applies, recommendation),
+# in output order - water quality first as the highest priority for the Ganga
+_RECOMMENDATION_RULES = (
+    ('water_quality', 70, {
+        'priority': 'HIGH',
+        'category': 'Water Quality',
+        'action': 'Investigate upstream pollution sources and implement water treatment',
+        'impact': 'Could improve overall score by 8-12 points',
+        'timeline': '1-3 months'
+    }),
+    ('vegetation_health', 70, {
+        'priority': 'MEDIUM',
+        'category': 'Vegetation',
+        'action': 'Implement riverbank afforestation with native species',
+        'impact': 'Could improve overall score by 5-8 points',
+        'timeline': '3-6 months'
+    }),
+    ('terrain_stability', 70, {
+        'priority': 'MEDIUM',
+        'category': 'Erosion Control',
+        'action': 'Install bio-engineering structures to stabilize riverbanks',
+        'impact': 'Could improve overall score by 4-6 points',
+        'timeline': '2-4 months'
+    }),
+    ('biodiversity_index', 70, {
+        'priority': 'LOW',
+        'category': 'Biodiversity',
+        'action': 'Create wildlife corridors and protect critical habitats',
+        'impact': 'Could improve overall score by 3-5 points',
+        'timeline': '6-12 months'
+    }),
+)
+
+_CRITICAL_RECOMMENDATION = {
+    'priority': 'CRITICAL',
+    'category': 'Emergency Response',
+    'action': 'Declare ecosystem emergency - coordinate multi-agency intervention',
+    'impact': 'Prevent further degradation',
+    'timeline': 'Immediate'
+}
+
+# Scores are integers, so the grade table can be expanded once into a direct
+# score -> grade index lookup; scores outside 0-100 clamp to F / A+ as before
+_GRADE_INDEX_BY_SCORE = np.array([bisect_right(_THRESHOLDS, score) for score in range(101)], dtype=np.intp)
+_GRADE_BY_SCORE = tuple(_GRADES[i] for i in _GRADE_INDEX_BY_SCORE)
+
+# Array forms of the grade table for batch scoring
+_GRADE_LABELS = np.array([grade for grade, _ in _GRADES])
+_STATUS_LABELS = np.array([status for _, status in _GRADES])
+
+# Array forms of the insight table for batch analysis: (component, band) -> message
+_FACTOR_COMPONENTS = tuple(component for component, _ in _FACTOR_INSIGHTS)
+_FACTOR_MESSAGES = np.array([messages for _, messages in _FACTOR_INSIGHTS], dtype=object)
 
 
 def calculate_ecosystem_health(
@@ -39,68 +138,60 @@ def calculate_ecosystem_health(
         Health status (Excellent, Good, Moderate, Poor, Critical)
     """
     
-    # Weighted importance of each component
-    weights = {
-        'vegetation': 0.30,  # 30% - Critical for soil stability and oxygen
-        'water': 0.35,       # 35% - Most critical for Ganga ecosystem
-        'terrain': 0.20,     # 20% - Important for flood prevention
-        'biodiversity': 0.15 # 15% - Long-term health indicator
-    }
-    
     # Calculate weighted score
     overall_score = (
-        vegetation_health * weights['vegetation'] +
-        water_quality * weights['water'] +
-        terrain_stability * weights['terrain'] +
-        biodiversity_index * weights['biodiversity']
+        vegetation_health * _WEIGHTS[0] +
+        water_quality * _WEIGHTS[1] +
+        terrain_stability * _WEIGHTS[2] +
+        biodiversity_index * _WEIGHTS[3]
     )
     
     overall_score = int(round(overall_score))
     
-    # Determine grade
-    if overall_score >= 95:
-        grade = "A+"
-        status = "Excellent"
-    elif overall_score >= 90:
-        grade = "A"
-        status = "Excellent"
-    elif overall_score >= 85:
-        grade = "A-"
-        status = "Excellent"
-    elif overall_score >= 80:
-        grade = "B+"
-        status = "Good"
-    elif overall_score >= 75:
-        grade = "B"
-        status = "Good"
-    elif overall_score >= 70:
-        grade = "B-"
-        status = "Good"
-    elif overall_score >= 65:
-        grade = "C+"
-        status = "Moderate"
-    elif overall_score >= 60:
-        grade = "C"
-        status = "Moderate"
-    elif overall_score >= 55:
-        grade = "C-"
-        status = "Moderate"
-    elif overall_score >= 50:
-        grade = "D+"
-        status = "Poor"
-    elif overall_score >= 45:
-        grade = "D"
-        status = "Poor"
-    elif overall_score >= 40:
-        grade = "D-"
-        status = "Poor"
-    else:
-        grade = "F"
-        status = "Critical"
+    grade, status = _GRADE_BY_SCORE[min(max(overall_score, 0), 100)]
     
     return overall_score, grade, status
 
 
+def calculate_ecosystem_health_batch(
+    vegetation_health: np.ndarray,
+    water_quality: np.ndarray,
+    terrain_stability: np.ndarray,
+    biodiversity_index: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized calculate_ecosystem_health for many sites or days at once.
+    
+    Parameters:
+    -----------
+    vegetation_health, water_quality, terrain_stability, biodiversity_index : array-like (0-100)
+        Component scores, broadcastable to a common shape
+    
+    Returns:
+    --------
+    overall_scores : np.ndarray of int32
+        Weighted ecosystem health scores
+    grades : np.ndarray of str
+        Letter grades (A+ to F)
+    statuses : np.ndarray of str
+        Health statuses (Excellent, Good, Moderate, Poor, Critical)
+    """
+    
+    # Same summation order as the scalar version so .5 ties round identically
+    # (a matmul accumulates in a different order); np.round is half-to-even like round()
+    overall_scores = (
+        np.asarray(vegetation_health, dtype=np.float64) * _WEIGHTS[0] +
+        np.asarray(water_quality, dtype=np.float64) * _WEIGHTS[1] +
+        np.asarray(terrain_stability, dtype=np.float64) * _WEIGHTS[2] +
+        np.asarray(biodiversity_index, dtype=np.float64) * _WEIGHTS[3]
+    )
+    overall_scores = np.round(overall_scores).astype(np.int32)
+    
+    idx = _GRADE_INDEX_BY_SCORE[np.clip(overall_scores, 0, 100)]
+    
+    return overall_scores, _GRADE_LABELS[idx], _STATUS_LABELS[idx]
+
+
 def get_health_trend(days: int = 30) -> Dict[str, List]:
     """
     Generate synthetic health trend data for the last N days.
@@ -120,21 +211,28 @@ def get_health_trend(days: int = 30) -> Dict[str, List]:
     end_date = datetime.now()
     dates = [end_date - timedelta(days=i) for i in range(days-1, -1, -1)]
     
+    return {
+        'dates': dates,
+        'scores': _health_trend_scores(days).tolist()
+    }
+
+
+@lru_cache(maxsize=32)
+def _health_trend_scores(days: int) -> np.ndarray:
+    """Synthetic overall scores for get_health_trend (deterministic per days, so cached)"""
     # Generate synthetic scores with realistic variation
     # Start from 75, gradually decline to current 67
     base_scores = np.linspace(75, 67, days)
     
     # Add realistic daily variation (±3 points)
-    np.random.seed(42)  # For reproducibility
-    daily_variation = np.random.normal(0, 2, days)
+    rng = np.random.default_rng(42)  # For reproducibility, without touching global state
+    daily_variation = rng.normal(0, 2, days)
     
     scores = base_scores + daily_variation
     scores = np.clip(scores, 0, 100)  # Keep in valid range
+    scores.flags.writeable = False  # Shared by every caller
     
-    return {
-        'dates': dates,
-        'scores': scores.tolist()
-    }
+    return scores
 
 
 def get_component_trends(days: int = 30) -> Dict[str, Dict]:
@@ -149,7 +247,23 @@ def get_component_trends(days: int = 30) -> Dict[str, Dict]:
     end_date = datetime.now()
     dates = [end_date - timedelta(days=i) for i in range(days-1, -1, -1)]
     
-    np.random.seed(42)
+    trends = {}
+    for component, scores in _component_trend_scores(days).items():
+        trends[component] = {
+            'dates': dates,
+            'scores': scores.tolist(),
+            'current': scores[-1],
+            'change_7d': scores[-1] - scores[-8],
+            'change_30d': scores[-1] - scores[0]
+        }
+    
+    return trends
+
+
+@lru_cache(maxsize=32)
+def _component_trend_scores(days: int) -> Dict[str, np.ndarray]:
+    """Synthetic per-component scores for get_component_trends (deterministic per days, so cached)"""
+    rng = np.random.default_rng(42)  # For reproducibility, without touching global state
     
     # Each component has different trend
     components = {
@@ -171,21 +285,15 @@ def get_component_trends(days: int = 30) -> Dict[str, Dict]:
         }
     }
     
-    trends = {}
+    component_scores = {}
     for component, params in components.items():
-        variation = np.random.normal(0, params['variation'], days)
+        variation = rng.normal(0, params['variation'], days)
         scores = params['base'] + variation
         scores = np.clip(scores, 0, 100)
-        
-        trends[component] = {
-            'dates': dates,
-            'scores': scores.tolist(),
-            'current': scores[-1],
-            'change_7d': scores[-1] - scores[-8],
-            'change_30d': scores[-1] - scores[0]
-        }
+        scores.flags.writeable = False  # Shared by every caller
+        component_scores[component] = scores
     
-    return trends
+    return component_scores
 
 
 def analyze_health_factors(
@@ -202,41 +310,37 @@ def analyze_health_factors(
     dict with insights for each component
     """
     
-    insights = {}
-    
-    # Vegetation
-    if vegetation_health >= 80:
-        insights['vegetation'] = "✅ Excellent vegetation cover - ecosystem is thriving"
-    elif vegetation_health >= 60:
-        insights['vegetation'] = "⚠️ Moderate vegetation health - monitor for declining trends"
-    else:
-        insights['vegetation'] = "🔴 Poor vegetation health - urgent restoration needed"
-    
-    # Water Quality
-    if water_quality >= 80:
-        insights['water'] = "✅ Clean water - safe for ecosystem and human use"
-    elif water_quality >= 60:
-        insights['water'] = "⚠️ Moderate pollution - requires monitoring and intervention"
-    else:
-        insights['water'] = "🔴 Critical pollution levels - immediate action required"
-    
-    # Terrain
-    if terrain_stability >= 80:
-        insights['terrain'] = "✅ Stable riverbanks - low erosion risk"
-    elif terrain_stability >= 60:
-        insights['terrain'] = "⚠️ Some erosion detected - preventive measures recommended"
-    else:
-        insights['terrain'] = "🔴 High erosion risk - structural interventions needed"
-    
-    # Biodiversity
-    if biodiversity_index >= 80:
-        insights['biodiversity'] = "✅ Rich biodiversity - healthy ecosystem indicators"
-    elif biodiversity_index >= 60:
-        insights['biodiversity'] = "⚠️ Declining species diversity - habitat restoration suggested"
-    else:
-        insights['biodiversity'] = "🔴 Low biodiversity - ecosystem under stress"
-    
-    return insights
+    scores = (vegetation_health, water_quality, terrain_stability, biodiversity_index)
+    
+    # A NaN score (missing data) fails every comparison, so it gets the lowest band
+    return {
+        component: messages[0] if score != score else messages[bisect_right(_FACTOR_BANDS, score)]
+        for (component, messages), score in zip(_FACTOR_INSIGHTS, scores)
+    }
+
+
+def analyze_health_factors_batch(component_scores: np.ndarray) -> np.ndarray:
+    """
+    Vectorized analyze_health_factors for many sites or days at once.
+    
+    Parameters:
+    -----------
+    component_scores : np.ndarray of shape (N, 4)
+        Columns in argument order: vegetation_health, water_quality,
+        terrain_stability, biodiversity_index
+    
+    Returns:
+    --------
+    np.ndarray of shape (N, 4), dtype object
+        Insight message per site and component (columns as _FACTOR_COMPONENTS:
+        vegetation, water, terrain, biodiversity)
+    """
+    
+    component_scores = np.asarray(component_scores, dtype=np.float64)
+    bands = np.searchsorted(_FACTOR_BANDS, component_scores, side='right')
+    bands[np.isnan(component_scores)] = 0  # Missing data gets the lowest band, as in the scalar path
+    
+    return _FACTOR_MESSAGES[np.arange(len(_FACTOR_INSIGHTS)), bands]
 
 
 def get_health_recommendations(overall_score: int, component_scores: Dict[str, float]) -> List[Dict]:
@@ -248,57 +352,16 @@ def get_health_recommendations(overall_score: int, component_scores: Dict[str, f
     list of recommendation dicts with priority, action, and impact
     """
     
-    recommendations = []
-    
-    # Water quality issues (highest priority for Ganga)
-    if component_scores['water_quality'] < 70:
-        recommendations.append({
-            'priority': 'HIGH',
-            'category': 'Water Quality',
-            'action': 'Investigate upstream pollution sources and implement water treatment',
-            'impact': 'Could improve overall score by 8-12 points',
-            'timeline': '1-3 months'
-        })
-    
-    # Vegetation restoration
-    if component_scores['vegetation_health'] < 70:
-        recommendations.append({
-            'priority': 'MEDIUM',
-            'category': 'Vegetation',
-            'action': 'Implement riverbank afforestation with native species',
-            'impact': 'Could improve overall score by 5-8 points',
-            'timeline': '3-6 months'
-        })
-    
-    # Erosion control
-    if component_scores['terrain_stability'] < 70:
-        recommendations.append({
-            'priority': 'MEDIUM',
-            'category': 'Erosion Control',
-            'action': 'Install bio-engineering structures to stabilize riverbanks',
-            'impact': 'Could improve overall score by 4-6 points',
-            'timeline': '2-4 months'
-        })
-    
-    # Biodiversity enhancement
-    if component_scores['biodiversity_index'] < 70:
-        recommendations.append({
-            'priority': 'LOW',
-            'category': 'Biodiversity',
-            'action': 'Create wildlife corridors and protect critical habitats',
-            'impact': 'Could improve overall score by 3-5 points',
-            'timeline': '6-12 months'
-        })
+    # Copies, so callers can annotate the records without touching the tables
+    recommendations = [
+        dict(record)
+        for component, threshold, record in _RECOMMENDATION_RULES
+        if component_scores[component] < threshold
+    ]
     
     # Overall health critical
     if overall_score < 50:
-        recommendations.insert(0, {
-            'priority': 'CRITICAL',
-            'category': 'Emergency Response',
-            'action': 'Declare ecosystem emergency - coordinate multi-agency intervention',
-            'impact': 'Prevent further degradation',
-            'timeline': 'Immediate'
-        })
+        recommendations.insert(0, dict(_CRITICAL_RECOMMENDATION))
     
     return recommendations
 
@@ -3,24 +3,58 @@ Flood Analysis Module
 Advanced flood inundation modeling and risk assessment
 """
 
+import threading
 import numpy as np
 from typing import Tuple, Dict, List
 from pathlib import Path
 
+# Per-thread scratch space for calculate_flood_statistics (see _scratch_buffer)
+_scratch = threading.local()
 
-def calculate_flood_depth(dem: np.ndarray, water_level: float) -> np.ndarray:
+# Record layout of generate_flood_scenarios_array
+SCENARIO_DTYPE = np.dtype([
+    ('water_level_m', 'f4'),
+    ('flooded_pixels', 'i8'),
+    ('flooded_area_km2', 'f4'),
+    ('max_depth_m', 'f4'),
+    ('avg_depth_m', 'f4'),
+    ('percent_flooded', 'f4'),
+])
+
+# Infrastructure flood-depth bands (m) and the risk level of each band
+_RISK_DEPTH_BANDS = np.array([0.5, 2.0])
+_RISK_LEVELS = ("Safe", "Low", "Medium", "High")
+
+
+def calculate_flood_depth(dem: np.ndarray, water_level: float,
+                          out: np.ndarray = None) -> np.ndarray:
     """
     Calculate flood depth at each point given a water surface elevation
     
     Args:
         dem: Digital Elevation Model (terrain heights in meters)
         water_level: Water surface elevation (meters)
+        out: Optional buffer (DEM shape) to write the depths into, so repeated
+            calls can reuse one allocation
     
     Returns:
         Flood depth array (0 = no flooding, >0 = water depth in meters)
     """
-    flood_depth = np.maximum(water_level - dem, 0)
-    return flood_depth
+    if out is None:
+        out = np.empty(dem.shape, dtype=np.result_type(dem, water_level))
+    
+    # Subtract and clamp in place: one output buffer, no temporary
+    np.subtract(water_level, dem, out=out)
+    np.maximum(out, 0, out=out)
+    return out
+
+
+def _scratch_buffer(shape: Tuple[int, ...], dtype) -> np.ndarray:
+    """Per-thread reusable buffer for full-DEM temporaries (reallocated on shape/dtype change)"""
+    buffer = getattr(_scratch, 'buffer', None)
+    if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+        buffer = _scratch.buffer = np.empty(shape, dtype=dtype)
+    return buffer
 
 
 def create_flood_zones(dem: np.ndarray, water_levels: List[float]) -> Dict[str, np.ndarray]:
@@ -40,15 +74,14 @@ def create_flood_zones(dem: np.ndarray, water_levels: List[float]) -> Dict[str,
         flood_mask = dem < level
         zones[f"{level}m"] = flood_mask
     
-    # Create risk categories
+    # Create risk categories from the level masks above (1-byte bool ops)
+    # instead of comparing the full DEM against the levels again
     if len(water_levels) >= 3:
-        high = dem < water_levels[0]
-        medium = (dem >= water_levels[0]) & (dem < water_levels[1])
-        low = (dem >= water_levels[1]) & (dem < water_levels[2])
+        below_0, below_1, below_2 = (zones[f"{level}m"] for level in water_levels[:3])
         
-        zones['high_risk'] = high
-        zones['medium_risk'] = medium
-        zones['low_risk'] = low
+        zones['high_risk'] = below_0.copy()
+        zones['medium_risk'] = below_1 & ~below_0
+        zones['low_risk'] = below_2 & ~below_1
     
     return zones
 
@@ -66,9 +99,27 @@ def calculate_flood_statistics(dem: np.ndarray, water_level: float,
     Returns:
         Dictionary with flood statistics
     """
-    flood_depth = calculate_flood_depth(dem, water_level)
-    flooded_pixels = np.sum(flood_depth > 0)
-    
+    depth_dtype = np.result_type(dem, water_level)
+    flood_depth = calculate_flood_depth(dem, water_level, out=_scratch_buffer(dem.shape, depth_dtype))
+    flooded = flood_depth > 0
+    flooded_pixels = np.count_nonzero(flooded)
+    
+    # Dry pixels have depth exactly 0, so a plain sum equals the flooded-only sum
+    # without compacting the flooded depths into a copy. NaN cells (nodata) poison
+    # it, so only then fall back to the slower masked reduction.
+    depth_sum = np.sum(flood_depth)
+    if np.isnan(depth_sum):
+        depth_sum = np.sum(flood_depth, where=flooded)
+    
+    return _flood_stats_dict(
+        water_level, flooded_pixels, np.max(flood_depth),
+        depth_sum, dem.size, resolution
+    )
+
+
+def _flood_stats_dict(water_level: float, flooded_pixels: int, max_depth: float,
+                      depth_sum: float, total_pixels: int, resolution: float = 1.0) -> Dict:
+    """Format flood statistics from their raw reductions (shared by single and batched paths)"""
     # Calculate area (assuming 1m resolution)
     pixel_area = resolution ** 2  # square meters
     flooded_area_m2 = flooded_pixels * pixel_area
@@ -78,9 +129,9 @@ def calculate_flood_statistics(dem: np.ndarray, water_level: float,
         'water_level_m': water_level,
         'flooded_pixels': int(flooded_pixels),
         'flooded_area_km2': round(flooded_area_km2, 4),
-        'max_depth_m': round(float(np.max(flood_depth)), 2),
-        'avg_depth_m': round(float(np.mean(flood_depth[flood_depth > 0])), 2) if flooded_pixels > 0 else 0,
-        'percent_flooded': round(100 * flooded_pixels / dem.size, 2)
+        'max_depth_m': round(float(max_depth), 2),
+        'avg_depth_m': round(float(depth_sum / flooded_pixels), 2) if flooded_pixels > 0 else 0,
+        'percent_flooded': round(100 * flooded_pixels / total_pixels, 2)
     }
     
     return stats
@@ -98,22 +149,122 @@ def generate_flood_scenarios(dem: np.ndarray,
     Returns:
         List of scenario dictionaries with statistics
     """
-    min_elev = np.nanmin(dem)
-    max_elev = np.nanmax(dem)
+    water_levels, flooded_pixels, max_depth, depth_sum = _scenario_reductions(dem, num_scenarios)
     
-    # Create evenly spaced water levels
-    water_levels = np.linspace(min_elev + 1, max_elev, num_scenarios)
+    return [
+        _flood_stats_dict(water_levels[k], flooded_pixels[k], max_depth[k], depth_sum[k], dem.size)
+        for k in range(num_scenarios)
+    ]
+
+
+def generate_flood_scenarios_array(dem: np.ndarray, num_scenarios: int = 10,
+                                   resolution: float = 1.0) -> np.ndarray:
+    """
+    Same scenarios as generate_flood_scenarios, as one structured array
+    (SCENARIO_DTYPE fields, unrounded) instead of a list of dicts.
+    Use for many scenarios; convert at the API boundary with .tolist() or
+    pandas.DataFrame(scenarios).
     
-    scenarios = []
-    for level in water_levels:
-        stats = calculate_flood_statistics(dem, level)
-        scenarios.append(stats)
+    Args:
+        dem: Digital Elevation Model
+        num_scenarios: Number of water levels to simulate
+        resolution: Pixel resolution in meters (default 1m)
+    
+    Returns:
+        Structured array with one record per water level
+    """
+    water_levels, flooded_pixels, max_depth, depth_sum = _scenario_reductions(dem, num_scenarios)
+    
+    scenarios = np.empty(num_scenarios, dtype=SCENARIO_DTYPE)
+    scenarios['water_level_m'] = water_levels
+    scenarios['flooded_pixels'] = flooded_pixels
+    scenarios['flooded_area_km2'] = flooded_pixels * (resolution ** 2) / 1_000_000
+    scenarios['max_depth_m'] = max_depth
+    scenarios['avg_depth_m'] = depth_sum / np.maximum(flooded_pixels, 1)
+    scenarios['percent_flooded'] = 100 * flooded_pixels / dem.size
     
     return scenarios
 
 
+def _scenario_reductions(dem: np.ndarray, num_scenarios: int) -> Tuple[np.ndarray, ...]:
+    """
+    Water levels from minimum to maximum elevation, and for each level the
+    flooded pixel count, max depth and depth sum
+    """
+    analyzer = FloodAnalyzer(dem)
+    
+    # Create evenly spaced water levels
+    water_levels = np.linspace(analyzer.min_elevation + 1, analyzer.max_elevation, num_scenarios)
+    
+    return (water_levels, *analyzer.reductions(water_levels))
+
+
+class FloodAnalyzer:
+    """
+    Flood extent queries against a fixed DEM.
+    Sorts the elevations once (O(N log N)) and keeps their prefix sums, so each
+    water level is then answered in O(log N) instead of a full pass over the DEM:
+    the k cells below a level flood, with total depth level * k - sum(lowest k).
+    """
+    
+    def __init__(self, dem: np.ndarray, resolution: float = 1.0):
+        """
+        Args:
+            dem: Digital Elevation Model (NaN cells never flood)
+            resolution: Pixel resolution in meters (default 1m)
+        """
+        elevations = dem.ravel()
+        self._sorted = np.sort(elevations[~np.isnan(elevations)])
+        if self._sorted.size == 0:
+            raise ValueError("DEM has no valid elevations")
+        self._prefix = np.concatenate(([0.0], np.cumsum(self._sorted, dtype=np.float64)))
+        
+        self.total_pixels = dem.size
+        self.resolution = resolution
+        self.min_elevation = self._sorted[0]
+        self.max_elevation = self._sorted[-1]
+    
+    def reductions(self, water_levels) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Raw flood reductions for one or many water levels at once
+        
+        Returns:
+            Tuple of (flooded_pixels, max_depth_m, depth_sum_m) arrays
+        """
+        water_levels = np.asarray(water_levels, dtype=np.float64)
+        
+        # Cells strictly below the level flood (depth > 0)
+        flooded_pixels = np.searchsorted(self._sorted, water_levels, side='left')
+        depth_sum = water_levels * flooded_pixels - self._prefix[flooded_pixels]
+        max_depth = np.where(flooded_pixels > 0, water_levels - self.min_elevation, 0.0)
+        
+        return flooded_pixels, max_depth, depth_sum
+    
+    def stats(self, water_level: float) -> Dict:
+        """
+        Flood statistics for one water level, without a pass over the DEM
+        
+        Matches calculate_flood_statistics on DEMs without NaN cells. NaN
+        (nodata) cells are dropped here, so max_depth_m stays finite where
+        calculate_flood_statistics reports NaN; flooded_pixels and avg_depth_m
+        agree, and percent_flooded is still taken over all cells.
+        
+        Args:
+            water_level: Water surface elevation
+        
+        Returns:
+            Dictionary with flood statistics
+        """
+        flooded_pixels, max_depth, depth_sum = self.reductions(water_level)
+        return _flood_stats_dict(
+            water_level, flooded_pixels, max_depth, depth_sum,
+            self.total_pixels, self.resolution
+        )
+
+
 def identify_safe_zones(dem: np.ndarray, flood_level: float, 
-                        min_area_pixels: int = 100) -> np.ndarray:
+                        min_area_pixels: int = 100,
+                        pixel_weights: np.ndarray = None) -> np.ndarray:
     """
     Identify contiguous safe zones above flood level
     
@@ -121,6 +272,8 @@ def identify_safe_zones(dem: np.ndarray, flood_level: float,
         dem: Digital Elevation Model
         flood_level: Water surface elevation
         min_area_pixels: Minimum size for a zone to be considered safe
+        pixel_weights: Optional per-pixel weights (e.g. cell area or population);
+            zones are then filtered on their summed weight instead of pixel count
     
     Returns:
         Labeled array where each safe zone has a unique ID
@@ -133,13 +286,17 @@ def identify_safe_zones(dem: np.ndarray, flood_level: float,
     # Label connected components
     labeled_zones, num_zones = ndimage.label(safe_mask)
     
-    # Filter small zones
-    for zone_id in range(1, num_zones + 1):
-        zone_size = np.sum(labeled_zones == zone_id)
-        if zone_size < min_area_pixels:
-            labeled_zones[labeled_zones == zone_id] = 0
-    
-    return labeled_zones
+    # Filter small zones: size every label in one pass, then remap through a
+    # lookup table that sends small zones (and the background) to 0
+    if pixel_weights is None:
+        zone_sizes = np.bincount(labeled_zones.ravel(), minlength=num_zones + 1)
+    else:
+        zone_sizes = ndimage.sum_labels(pixel_weights, labeled_zones, index=np.arange(num_zones + 1))
+    keep = zone_sizes >= min_area_pixels
+    keep[0] = False
+    lut = np.where(keep, np.arange(num_zones + 1), 0).astype(labeled_zones.dtype)
+    
+    return lut[labeled_zones]
 
 
 def calculate_slope(dem: np.ndarray, resolution: float = 1.0) -> np.ndarray:
@@ -156,9 +313,14 @@ def calculate_slope(dem: np.ndarray, resolution: float = 1.0) -> np.ndarray:
     # Calculate gradients
     dy, dx = np.gradient(dem, resolution)
     
-    # Calculate slope magnitude
-    slope_rad = np.arctan(np.sqrt(dx**2 + dy**2))
-    slope_deg = np.degrees(slope_rad)
+    # Calculate slope magnitude, reusing the gradient buffers for every step
+    # (no temporaries beyond the two gradients)
+    np.multiply(dx, dx, out=dx)
+    np.multiply(dy, dy, out=dy)
+    slope_deg = np.add(dx, dy, out=dx)
+    np.sqrt(slope_deg, out=slope_deg)
+    np.arctan(slope_deg, out=slope_deg)
+    np.degrees(slope_deg, out=slope_deg)
     
     return slope_deg
 
@@ -177,31 +339,35 @@ def assess_infrastructure_risk(dem: np.ndarray,
     Returns:
         List of risk assessments for each point
     """
-    assessments = []
-    
-    for idx, (row, col) in enumerate(infrastructure_points):
-        if 0 <= row < dem.shape[0] and 0 <= col < dem.shape[1]:
-            elevation = dem[row, col]
-            depth = max(0, flood_level - elevation)
-            
-            if depth == 0:
-                risk = "Safe"
-            elif depth < 0.5:
-                risk = "Low"
-            elif depth < 2.0:
-                risk = "Medium"
-            else:
-                risk = "High"
-            
-            assessments.append({
-                'id': idx,
-                'location': (row, col),
-                'elevation_m': round(float(elevation), 2),
-                'flood_depth_m': round(depth, 2),
-                'risk_level': risk
-            })
-    
-    return assessments
+    if len(infrastructure_points) == 0:
+        return []
+    
+    # Gather every in-bounds point's elevation in one fancy-indexing call
+    points = np.asarray(infrastructure_points, dtype=np.intp).reshape(-1, 2)
+    rows, cols = points[:, 0], points[:, 1]
+    valid = (rows >= 0) & (rows < dem.shape[0]) & (cols >= 0) & (cols < dem.shape[1])
+    ids = np.flatnonzero(valid)
+    rows, cols = rows[ids], cols[ids]
+    
+    elevations = dem[rows, cols]
+    depths = np.fmax(flood_level - elevations, 0)  # fmax: NaN elevations count as dry
+    
+    # Safe when dry, otherwise banded by depth: < 0.5m Low, < 2m Medium, else High
+    risk_idx = np.where(depths > 0, np.searchsorted(_RISK_DEPTH_BANDS, depths, side='right') + 1, 0)
+    
+    return [
+        {
+            'id': int(idx),
+            'location': (int(row), int(col)),
+            'elevation_m': round(float(elevation), 2),
+            'flood_depth_m': round(float(depth), 2),
+            'risk_level': _RISK_LEVELS[risk]
+        }
+        for idx, row, col, elevation, depth, risk in zip(
+            ids.tolist(), rows.tolist(), cols.tolist(),
+            elevations.tolist(), depths.tolist(), risk_idx.tolist()
+        )
+    ]
 
 
 if __name__ == '__main__':
@@ -5,7 +5,14 @@ Identify areas and assets at risk from flooding
 
 import numpy as np
 from typing import List, Dict, Tuple
-from scipy.ndimage import distance_transform_edt
+from scipy.ndimage import binary_dilation, generate_binary_structure
+
+# 4- and 8-connected structuring elements for _grow_octagon
+_CROSS = generate_binary_structure(2, 1)
+_SQUARE = generate_binary_structure(2, 2)
+
+# Margin above flood level (m) where each lower risk zone starts
+_MARGIN_EDGES = np.array([0.0, 1.0, 2.0, 3.0])
 
 
 def calculate_flood_risk_zones(dem: np.ndarray, flood_level: float) -> np.ndarray:
@@ -17,19 +24,17 @@ def calculate_flood_risk_zones(dem: np.ndarray, flood_level: float) -> np.ndarra
         flood_level: Water level in meters
         
     Returns:
-        Risk zone array: 0=safe, 1=low, 2=medium, 3=high, 4=critical
+        uint8 risk zone array: 0=safe, 1=low, 2=medium, 3=high, 4=critical
     """
-    risk_zones = np.zeros_like(dem, dtype=int)
-    
     # Calculate margin above flood level
     margin = dem - flood_level
     
-    # Classify risk zones
-    risk_zones[margin < 0] = 4  # Critical - below flood level
-    risk_zones[(margin >= 0) & (margin < 1)] = 3  # High - within 1m
-    risk_zones[(margin >= 1) & (margin < 2)] = 2  # Medium - within 2m
-    risk_zones[(margin >= 2) & (margin < 3)] = 1  # Low - within 3m
-    # margin >= 3 stays 0 (safe)
+    # Classify risk zones in one pass: the number of band edges at or below the
+    # margin is 0 below flood level (critical) up to 4 at 3m+ (safe), so risk = 4 - that.
+    # NaN sorts past every edge and ends up safe, as before.
+    #   < 0 -> 4 critical, 0-1m -> 3 high, 1-2m -> 2 medium, 2-3m -> 1 low, >= 3m -> 0 safe
+    risk_zones = np.searchsorted(_MARGIN_EDGES, margin, side='right').astype(np.uint8)
+    np.subtract(4, risk_zones, out=risk_zones)
     
     return risk_zones
 
@@ -50,53 +55,55 @@ def assess_infrastructure_impact(
     Returns:
         Impact assessment dictionary
     """
+    # Pull the pixel coordinates out once; array indexing is [row, col] = [y, x]
+    rows = np.array([int(point['y']) for point in infrastructure_points], dtype=np.intp)
+    cols = np.array([int(point['x']) for point in infrastructure_points], dtype=np.intp)
+    valid = (rows >= 0) & (rows < risk_zones.shape[0]) & (cols >= 0) & (cols < risk_zones.shape[1])
+    ids = np.flatnonzero(valid)
+    risk_levels = risk_zones[rows[ids], cols[ids]]
+    
+    # Count by risk level (anything outside 1-4 counts as safe)
+    buckets = np.where(np.isin(risk_levels, (1, 2, 3, 4)), risk_levels, 0).astype(np.intp)
+    level_counts = np.bincount(buckets, minlength=5)
+    
     impact = {
         'total_structures': len(infrastructure_points),
-        'critical_risk': 0,
-        'high_risk': 0,
-        'medium_risk': 0,
-        'low_risk': 0,
-        'safe': 0,
+        'critical_risk': int(level_counts[4]),
+        'high_risk': int(level_counts[3]),
+        'medium_risk': int(level_counts[2]),
+        'low_risk': int(level_counts[1]),
+        'safe': int(level_counts[0]),
         'by_type': {}
     }
     
-    for point in infrastructure_points:
-        x, y = int(point['y']), int(point['x'])  # Note: array indexing is [row, col]
-        
-        if 0 <= x < risk_zones.shape[0] and 0 <= y < risk_zones.shape[1]:
-            risk_level = risk_zones[x, y]
-            infra_type = point.get('type', 'unknown')
-            
-            # Count by risk level
-            if risk_level == 4:
-                impact['critical_risk'] += 1
-                status = 'critical'
-            elif risk_level == 3:
-                impact['high_risk'] += 1
-                status = 'high'
-            elif risk_level == 2:
-                impact['medium_risk'] += 1
-                status = 'medium'
-            elif risk_level == 1:
-                impact['low_risk'] += 1
-                status = 'low'
-            else:
-                impact['safe'] += 1
-                status = 'safe'
-            
-            # Track by infrastructure type
-            if infra_type not in impact['by_type']:
-                impact['by_type'][infra_type] = {'total': 0, 'at_risk': 0, 'critical': 0}
-            
-            impact['by_type'][infra_type]['total'] += 1
-            if risk_level >= 2:
-                impact['by_type'][infra_type]['at_risk'] += 1
-            if risk_level >= 4:
-                impact['by_type'][infra_type]['critical'] += 1
+    # Track by infrastructure type, in order of first appearance
+    types = [infrastructure_points[i].get('type', 'unknown') for i in ids.tolist()]
+    type_index = {infra_type: n for n, infra_type in enumerate(dict.fromkeys(types))}
+    type_ids = np.array([type_index[infra_type] for infra_type in types], dtype=np.intp)
+    totals = np.bincount(type_ids, minlength=len(type_index))
+    at_risk = np.bincount(type_ids, weights=risk_levels >= 2, minlength=len(type_index))
+    critical = np.bincount(type_ids, weights=risk_levels >= 4, minlength=len(type_index))
+    
+    for infra_type, n in type_index.items():
+        impact['by_type'][infra_type] = {
+            'total': int(totals[n]),
+            'at_risk': int(at_risk[n]),
+            'critical': int(critical[n])
+        }
     
     return impact
 
 
+def _grow_octagon(mask: np.ndarray, radius: int) -> np.ndarray:
+    """
+    Dilate a mask by about `radius` pixels in every direction.
+    Half the steps are 4-connected and half 8-connected, which grows an octagon:
+    exact along the axes and within ~6% of a Euclidean disk on the diagonals.
+    """
+    grown = binary_dilation(mask, structure=_CROSS, iterations=radius // 2)
+    return binary_dilation(grown, structure=_SQUARE, iterations=radius - radius // 2)
+
+
 def calculate_evacuation_zones(dem: np.ndarray, flood_level: float, buffer_m: float = 100) -> Dict:
     """
     Calculate safe evacuation zones and routes
@@ -112,20 +119,23 @@ def calculate_evacuation_zones(dem: np.ndarray, flood_level: float, buffer_m: fl
     # Find safe areas (above flood level + buffer)
     safe_mask = dem >= (flood_level + 2.0)
     
-    # Calculate distance to nearest safe zone for flooded areas
     flooded_mask = dem < flood_level
-    distance_to_safety = distance_transform_edt(~safe_mask)
     
-    # Calculate evacuation priority (closer to flood = higher priority)
-    evacuation_priority = np.zeros_like(dem)
+    # Distance bands around safe ground by growing it 50 + 50 pixels (1m each),
+    # instead of a full float64 distance transform that is only thresholded
+    within_50m = _grow_octagon(safe_mask, 50)
+    within_100m = _grow_octagon(within_50m, 50)
+    
+    # Calculate evacuation priority (closer to flood = higher priority), 0-3
+    evacuation_priority = np.zeros(dem.shape, dtype=np.uint8)
     evacuation_priority[flooded_mask] = 3  # Immediate evacuation
     
-    # Areas within 50m of flooded zone
-    near_flood = (distance_to_safety > 0) & (distance_to_safety <= 50) & ~flooded_mask
+    # Areas within 50m of safe ground
+    near_flood = within_50m & ~safe_mask & ~flooded_mask
     evacuation_priority[near_flood] = 2
     
-    # Areas 50-100m from flooded zone
-    moderate_distance = (distance_to_safety > 50) & (distance_to_safety <= 100) & ~flooded_mask
+    # Areas 50-100m from safe ground
+    moderate_distance = within_100m & ~within_50m & ~flooded_mask
     evacuation_priority[moderate_distance] = 1
     
     pixel_area_m2 = 1.0  # 1m resolution
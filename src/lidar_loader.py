@@ -22,7 +22,7 @@ def load_combined_tiles(zone_name: str) -> Tuple[np.ndarray, np.ndarray, dict]:
     dem : np.ndarray
         Digital Elevation Model
     rgb : np.ndarray  
-        RGB orthophoto (or empty if unavailable)
+        RGBA orthophoto, alpha 0 in padding (grayscale heightmap if unavailable)
     metadata : dict
         Metadata about the loaded tiles
     """
@@ -33,4 +33,9 @@ def load_combined_tiles(zone_name: str) -> Tuple[np.ndarray, np.ndarray, dict]:
     dataset = LiDARDataset(zone_name=zone_name, load_ortho=load_ortho)
     dem, rgb, metadata = dataset.load_combined_tiles()
     
+    # Kernels scan the DEM on its own; keep it a separate C-ordered float32 block
+    # (no-ops for the loader's current output, cheap insurance for callers)
+    dem = np.ascontiguousarray(dem, dtype=np.float32)
+    rgb = np.ascontiguousarray(rgb, dtype=np.uint8)
+    
     return dem, rgb, metadata
@@ -4,9 +4,56 @@ Simulate real-time environmental monitoring data
 """
 
 import numpy as np
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple
-import random
+from typing import Dict, List, Tuple, Optional
+
+# Uniform noise bounds for current water level, pH, DO, temperature,
+# turbidity, conductivity and flow rate
+_READING_NOISE_LOW = np.array([-0.5, -0.3, -1.0, -2.0, -5.0, -50.0, -3.0])
+_READING_NOISE_HIGH = np.array([0.5, 0.3, 1.0, 2.0, 10.0, 100.0, 5.0])
+
+# Uniform noise bounds for historical water level, pH, DO and temperature
+_HISTORICAL_NOISE_LOW = np.array([-0.3, -0.2, -0.5, -1.0])
+_HISTORICAL_NOISE_HIGH = np.array([0.3, 0.2, 0.5, 1.0])
+
+# Lower WQI bound of each quality category, best first
+_WQI_THRESHOLDS = (90, 70, 50, 30)
+_WQI_CATEGORIES = ("Excellent", "Good", "Fair", "Poor", "Very Poor")
+
+
+@dataclass
+class MeasurementBuffer:
+    """
+    Historical sensor measurements stored as arrays, one row per sensor
+    
+    Each parameter array has shape (num_sensors, num_timesteps) and is ordered
+    oldest first along the time axis, matching `timestamps`.
+    """
+    sensor_ids: List[str]
+    timestamps: List[str]
+    water_level: np.ndarray
+    ph: np.ndarray
+    dissolved_oxygen: np.ndarray
+    temperature: np.ndarray
+    
+    def to_dict(self) -> Dict[str, List[Dict]]:
+        """Expand into the per-sensor list-of-dicts format of get_historical_data"""
+        historical = {}
+        for s, sensor_id in enumerate(self.sensor_ids):
+            historical[sensor_id] = [
+                {
+                    'timestamp': ts,
+                    'water_level_m': wl,
+                    'ph': p,
+                    'dissolved_oxygen_mg_l': do,
+                    'temperature_c': temp
+                }
+                for ts, wl, p, do, temp in zip(self.timestamps, self.water_level[s].tolist(), self.ph[s].tolist(),
+                                              self.dissolved_oxygen[s].tolist(), self.temperature[s].tolist())
+            ]
+        
+        return historical
 
 
 class MockSensorNetwork:
@@ -16,6 +63,7 @@ class MockSensorNetwork:
         self.num_sensors = num_sensors
         self.sensors = self._initialize_sensors()
         self.baseline_time = datetime.now()
+        self._rng = np.random.default_rng()
         
     def _initialize_sensors(self) -> List[Dict]:
         """Create mock sensor stations"""
@@ -35,7 +83,9 @@ class MockSensorNetwork:
                 'location': {'lon': lon, 'lat': lat},
                 'status': 'active',
                 'last_update': datetime.now(),
-                'battery': 95 - i * 5  # Simulate different battery levels
+                'battery': 95 - i * 5,  # Simulate different battery levels
+                'index': i,
+                'location_offset': i * 0.1  # Location difference along the river
             })
         
         return sensors
@@ -44,43 +94,52 @@ class MockSensorNetwork:
         """Generate current sensor readings with realistic variations"""
         readings = []
         current_time = datetime.now()
+        now_iso = current_time.isoformat()
         
         # Simulate time-based variations (e.g., daily cycles)
         hour = current_time.hour
         time_factor = np.sin((hour - 6) * np.pi / 12)  # Peak at noon
         
-        for sensor in self.sensors:
+        # One draw per reading cycle: a row of perturbations per sensor, plus
+        # the dice for simulated communication delays
+        noise = self._rng.uniform(_READING_NOISE_LOW, _READING_NOISE_HIGH,
+                                  size=(len(self.sensors), len(_READING_NOISE_LOW))).tolist()
+        comm_delays = (self._rng.random(len(self.sensors)) < 0.05).tolist()  # 5% chance
+        
+        for sensor, sensor_noise, comm_delay in zip(self.sensors, noise, comm_delays):
+            wl_noise, ph_noise, do_noise, temp_noise, turb_noise, cond_noise, flow_noise = sensor_noise
+            
             # Base values with time variations
             ph_base = 7.2 + time_factor * 0.3
             do_base = 7.5 + time_factor * 1.5  # Dissolved Oxygen peaks in afternoon
             temp_base = 22 + time_factor * 5  # Temperature follows sun
-            turbidity_base = 15 + random.uniform(-5, 10)
+            turbidity_base = 15 + turb_noise
             
             # Add sensor-specific offsets (location differences)
-            sensor_idx = int(sensor['id'].split('_')[1]) - 1
-            location_offset = sensor_idx * 0.1
+            location_offset = sensor['location_offset']
             
             reading = {
                 'sensor_id': sensor['id'],
                 'sensor_name': sensor['name'],
-                'timestamp': current_time.isoformat(),
+                'timestamp': now_iso,
                 'measurements': {
-                    'water_level_m': round(2.5 + random.uniform(-0.5, 0.5) + location_offset, 2),
-                    'ph': round(ph_base + random.uniform(-0.3, 0.3), 2),
-                    'dissolved_oxygen_mg_l': round(max(0, do_base + random.uniform(-1, 1)), 2),
-                    'temperature_c': round(temp_base + random.uniform(-2, 2), 1),
+                    'water_level_m': round(2.5 + wl_noise + location_offset, 2),
+                    'ph': round(ph_base + ph_noise, 2),
+                    'dissolved_oxygen_mg_l': round(max(0, do_base + do_noise), 2),
+                    'temperature_c': round(temp_base + temp_noise, 1),
                     'turbidity_ntu': round(max(0, turbidity_base), 1),
-                    'conductivity_us_cm': round(450 + random.uniform(-50, 100), 0),
-                    'flow_rate_m3_s': round(15 + random.uniform(-3, 5) + location_offset, 1)
+                    'conductivity_us_cm': round(450 + cond_noise, 0),
+                    'flow_rate_m3_s': round(15 + flow_noise + location_offset, 1)
                 },
-                'alerts': self._check_alerts(sensor_idx, ph_base, do_base, turbidity_base)
+                'alerts': self._check_alerts(sensor['index'], ph_base, do_base, turbidity_base, comm_delay)
             }
             
             readings.append(reading)
         
         return readings
     
-    def _check_alerts(self, sensor_idx: int, ph: float, do: float, turbidity: float) -> List[str]:
+    def _check_alerts(self, sensor_idx: int, ph: float, do: float, turbidity: float,
+                      comm_delay: Optional[bool] = None) -> List[str]:
         """Check if any parameters exceed thresholds"""
         alerts = []
         
@@ -95,47 +154,59 @@ class MockSensorNetwork:
             alerts.append(f"⚠️ High turbidity: {turbidity:.1f} NTU")
         
         # Simulate occasional random alerts
-        if random.random() < 0.05:  # 5% chance
+        if comm_delay is None:
+            comm_delay = self._rng.random() < 0.05  # 5% chance
+        if comm_delay:
             alerts.append("ℹ️ Communication delay detected")
         
         return alerts
     
-    def get_historical_data(self, hours: int = 24) -> Dict[str, List[Dict]]:
-        """Generate historical data for trending"""
-        historical = {sensor['id']: [] for sensor in self.sensors}
-        
+    def get_historical_buffer(self, hours: int = 24) -> MeasurementBuffer:
+        """Generate historical data for trending as per-parameter arrays"""
+        num_points = hours * 6  # Data every 10 minutes
         current_time = datetime.now()
-        for i in range(hours * 6):  # Data every 10 minutes
-            timestamp = current_time - timedelta(minutes=i * 10)
-            hour = timestamp.hour
-            time_factor = np.sin((hour - 6) * np.pi / 12)
-            
-            for sensor in self.sensors:
-                sensor_idx = int(sensor['id'].split('_')[1]) - 1
-                
-                data_point = {
-                    'timestamp': timestamp.isoformat(),
-                    'water_level_m': 2.5 + random.uniform(-0.3, 0.3) + sensor_idx * 0.1,
-                    'ph': 7.2 + time_factor * 0.3 + random.uniform(-0.2, 0.2),
-                    'dissolved_oxygen_mg_l': max(0, 7.5 + time_factor * 1.5 + random.uniform(-0.5, 0.5)),
-                    'temperature_c': 22 + time_factor * 5 + random.uniform(-1, 1)
-                }
-                
-                historical[sensor['id']].insert(0, data_point)
         
-        return historical
+        # Oldest first, so each series is already in chronological order
+        timestamps = [current_time - timedelta(minutes=i * 10) for i in range(num_points - 1, -1, -1)]
+        iso_timestamps = [timestamp.isoformat() for timestamp in timestamps]
+        hours_arr = np.fromiter((timestamp.hour for timestamp in timestamps), dtype=float, count=num_points)
+        time_factor = np.sin((hours_arr - 6) * np.pi / 12)
+        
+        # One draw for every perturbation: (parameter, sensor, timestep)
+        noise = self._rng.uniform(_HISTORICAL_NOISE_LOW, _HISTORICAL_NOISE_HIGH,
+                                  size=(len(self.sensors), num_points, 4)).transpose(2, 0, 1)
+        location_offset = np.array([sensor['location_offset'] for sensor in self.sensors])
+        
+        return MeasurementBuffer(
+            sensor_ids=[sensor['id'] for sensor in self.sensors],
+            timestamps=iso_timestamps,
+            water_level=2.5 + noise[0] + location_offset[:, None],
+            ph=7.2 + time_factor * 0.3 + noise[1],
+            dissolved_oxygen=np.maximum(0, 7.5 + time_factor * 1.5 + noise[2]),
+            temperature=22 + time_factor * 5 + noise[3]
+        )
+    
+    def get_historical_data(self, hours: int = 24) -> Dict[str, List[Dict]]:
+        """Generate historical data for trending"""
+        return self.get_historical_buffer(hours).to_dict()
     
     def get_network_health(self) -> Dict:
         """Get overall network status"""
-        active_sensors = sum(1 for s in self.sensors if s['status'] == 'active')
-        avg_battery = np.mean([s['battery'] for s in self.sensors])
+        # Single pass: a handful of sensors is cheaper in plain Python than via np.mean
+        total_sensors = len(self.sensors)
+        active_sensors = 0
+        battery_total = 0.0
+        for s in self.sensors:
+            if s['status'] == 'active':
+                active_sensors += 1
+            battery_total += s['battery']
         
         return {
-            'total_sensors': len(self.sensors),
+            'total_sensors': total_sensors,
             'active_sensors': active_sensors,
-            'inactive_sensors': len(self.sensors) - active_sensors,
-            'network_uptime_%': (active_sensors / len(self.sensors)) * 100,
-            'average_battery_%': avg_battery,
+            'inactive_sensors': total_sensors - active_sensors,
+            'network_uptime_%': (active_sensors / total_sensors) * 100,
+            'average_battery_%': battery_total / total_sensors,
             'last_update': datetime.now().isoformat()
         }
 
@@ -157,15 +228,39 @@ def calculate_water_quality_index(readings: Dict) -> Tuple[float, str]:
     # Weighted average
     wqi = (ph_score * 0.3 + do_score * 0.4 + turbidity_score * 0.3)
     
-    if wqi >= 90:
-        category = "Excellent"
-    elif wqi >= 70:
-        category = "Good"
-    elif wqi >= 50:
-        category = "Fair"
-    elif wqi >= 30:
-        category = "Poor"
-    else:
-        category = "Very Poor"
+    category = _WQI_CATEGORIES[-1]
+    for threshold, label in zip(_WQI_THRESHOLDS, _WQI_CATEGORIES):
+        if wqi >= threshold:
+            category = label
+            break
     
     return wqi, category
+
+
+def calculate_wqi_batch(ph: np.ndarray, dissolved_oxygen: np.ndarray,
+                        turbidity: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate Water Quality Index for many readings at once
+    
+    Args:
+        ph: pH values
+        dissolved_oxygen: Dissolved oxygen in mg/L
+        turbidity: Turbidity in NTU
+        
+    Returns:
+        Tuple of (wqi_scores, quality_categories) arrays, matching
+        calculate_water_quality_index element by element
+    """
+    ph = np.asarray(ph, dtype=float)
+    dissolved_oxygen = np.asarray(dissolved_oxygen, dtype=float)
+    turbidity = np.asarray(turbidity, dtype=float)
+    
+    ph_score = np.where((ph >= 6.5) & (ph <= 8.5), 100.0, np.maximum(0, 100 - np.abs(7.0 - ph) * 20))
+    do_score = np.minimum(100, dissolved_oxygen / 8.0 * 100)
+    turbidity_score = np.maximum(0, 100 - turbidity * 2)
+    
+    wqi = ph_score * 0.3 + do_score * 0.4 + turbidity_score * 0.3
+    categories = np.select([wqi >= threshold for threshold in _WQI_THRESHOLDS],
+                           _WQI_CATEGORIES[:-1], _WQI_CATEGORIES[-1])
+    
+    return wqi, categories
@@ -6,6 +6,21 @@ Calculate vegetation health from RGB imagery
 import numpy as np
 from typing import Tuple, Dict
 
+# NDVI class boundaries and the stats key prefix for each class between them
+_NDVI_CLASS_EDGES = (-0.1, 0.2, 0.4, 0.6)
+_NDVI_CLASS_NAMES = ('water_area', 'bare_soil', 'sparse_vegetation', 'moderate_vegetation', 'dense_vegetation')
+
+# Plotly colorscale for NDVI, built once at import
+_NDVI_COLORMAP = (
+    (0.0, 'rgb(139, 69, 19)'),    # Dark brown (bare soil/low)
+    (0.25, 'rgb(210, 180, 140)'),  # Tan
+    (0.5, 'rgb(255, 255, 153)'),   # Light yellow
+    (0.65, 'rgb(173, 255, 47)'),   # Yellow-green
+    (0.75, 'rgb(50, 205, 50)'),    # Lime green
+    (0.85, 'rgb(34, 139, 34)'),    # Forest green
+    (1.0, 'rgb(0, 100, 0)')        # Dark green (dense vegetation)
+)
+
 def calculate_ndvi_from_rgb(rgb: np.ndarray) -> np.ndarray:
     """
     Calculate NDVI from RGB image using visible bands approximation
@@ -17,26 +32,35 @@ def calculate_ndvi_from_rgb(rgb: np.ndarray) -> np.ndarray:
         rgb: RGB array of shape (height, width, 3)
         
     Returns:
-        NDVI array of shape (height, width) with values from -1 to 1
+        float32 NDVI array of shape (height, width) with values from -1 to 1
     """
-    # Extract channels
-    red = rgb[:, :, 0].astype(float)
-    green = rgb[:, :, 1].astype(float)
-    blue = rgb[:, :, 2].astype(float)
+    # Extract channels (float32 is plenty for 8-bit bands)
+    red = rgb[:, :, 0].astype(np.float32)
+    green = rgb[:, :, 1].astype(np.float32)
     
     # Approximate NDVI using visible bands
     # For true NDVI we'd need NIR band, but we can use green as proxy
-    numerator = green - red
-    denominator = green + red + 1e-10  # Avoid division by zero
+    ndvi = np.subtract(green, red)
+    
+    # The green copy is not needed after this, so reuse it for the denominator
+    denominator = np.add(green, red, out=green)
+    denominator += np.float32(1e-10)  # Avoid division by zero
     
-    ndvi = numerator / denominator
+    np.divide(ndvi, denominator, out=ndvi)
     
     # Clip to valid range
-    ndvi = np.clip(ndvi, -1, 1)
+    np.clip(ndvi, -1, 1, out=ndvi)
     
     return ndvi
 
 
+def _mean_and_coverage(ndvi: np.ndarray) -> Tuple[float, float]:
+    """Mean NDVI (accumulated in float64) and % of pixels above 0.2"""
+    mean_ndvi = np.mean(ndvi, dtype=np.float64)
+    veg_coverage = np.count_nonzero(ndvi > 0.2) / ndvi.size * 100
+    return mean_ndvi, veg_coverage
+
+
 def classify_vegetation(ndvi: np.ndarray, dem: np.ndarray = None) -> Dict:
     """
     Classify vegetation health and calculate statistics
@@ -48,47 +72,40 @@ def classify_vegetation(ndvi: np.ndarray, dem: np.ndarray = None) -> Dict:
     Returns:
         Dictionary with classification statistics
     """
-    # Classification thresholds
-    water_mask = ndvi < -0.1
-    bare_soil = (ndvi >= -0.1) & (ndvi < 0.2)
-    sparse_veg = (ndvi >= 0.2) & (ndvi < 0.4)
-    moderate_veg = (ndvi >= 0.4) & (ndvi < 0.6)
-    dense_veg = ndvi >= 0.6
-    
-    total_pixels = ndvi.size
+    # Classification thresholds: cumulative counts below each edge give
+    # every band by subtraction, without building one mask per class
+    below = [np.count_nonzero(ndvi < edge) for edge in _NDVI_CLASS_EDGES]
+    class_counts = [below[0]] + [below[k] - below[k - 1] for k in range(1, len(below))]
+    class_counts.append(np.count_nonzero(ndvi >= _NDVI_CLASS_EDGES[-1]))
+    
     pixel_area_m2 = 1.0  # 1m resolution
     
     stats = {
-        'water_area_km2': np.sum(water_mask) * pixel_area_m2 / 1e6,
-        'bare_soil_km2': np.sum(bare_soil) * pixel_area_m2 / 1e6,
-        'sparse_vegetation_km2': np.sum(sparse_veg) * pixel_area_m2 / 1e6,
-        'moderate_vegetation_km2': np.sum(moderate_veg) * pixel_area_m2 / 1e6,
-        'dense_vegetation_km2': np.sum(dense_veg) * pixel_area_m2 / 1e6,
-        'mean_ndvi': float(np.mean(ndvi)),
-        'vegetation_coverage_%': float(np.sum(ndvi > 0.2) / total_pixels * 100)
+        f'{name}_km2': count * pixel_area_m2 / 1e6
+        for name, count in zip(_NDVI_CLASS_NAMES, class_counts)
     }
+    mean_ndvi, veg_coverage = _mean_and_coverage(ndvi)
+    stats['mean_ndvi'] = float(mean_ndvi)
+    stats['vegetation_coverage_%'] = float(veg_coverage)
     
     # Riparian zone analysis if DEM provided
     if dem is not None:
         # Identify low-lying areas near water (potential riparian zones)
-        elevation_percentile_10 = np.nanpercentile(dem, 10)
-        riparian_zone = (dem <= elevation_percentile_10 + 2) & (ndvi > 0.3)
-        stats['riparian_vegetation_km2'] = np.sum(riparian_zone) * pixel_area_m2 / 1e6
+        # np.percentile already selects with a partition; the NaN-aware
+        # variant only needs to run (and copy) when the DEM has nodata holes
+        elevation_percentile_10 = np.percentile(dem, 10)
+        if np.isnan(elevation_percentile_10):
+            elevation_percentile_10 = np.nanpercentile(dem, 10)
+        riparian_zone = dem <= elevation_percentile_10 + 2
+        riparian_zone &= ndvi > 0.3  # In place, so only one full-size mask is kept
+        stats['riparian_vegetation_km2'] = np.count_nonzero(riparian_zone) * pixel_area_m2 / 1e6
     
     return stats
 
 
 def get_ndvi_colormap():
-    """Return custom colorscale for NDVI visualization"""
-    return [
-        [0.0, 'rgb(139, 69, 19)'],    # Dark brown (bare soil/low)
-        [0.25, 'rgb(210, 180, 140)'],  # Tan
-        [0.5, 'rgb(255, 255, 153)'],   # Light yellow
-        [0.65, 'rgb(173, 255, 47)'],   # Yellow-green
-        [0.75, 'rgb(50, 205, 50)'],    # Lime green
-        [0.85, 'rgb(34, 139, 34)'],    # Forest green
-        [1.0, 'rgb(0, 100, 0)']        # Dark green (dense vegetation)
-    ]
+    """Return custom colorscale for NDVI visualization (shared; copy with list() to modify)"""
+    return _NDVI_COLORMAP
 
 
 def calculate_vegetation_health_score(ndvi: np.ndarray) -> Tuple[float, str]:
@@ -98,8 +115,7 @@ def calculate_vegetation_health_score(ndvi: np.ndarray) -> Tuple[float, str]:
     Returns:
         Tuple of (score, health_status)
     """
-    mean_ndvi = np.mean(ndvi)
-    veg_coverage = np.sum(ndvi > 0.2) / ndvi.size * 100
+    mean_ndvi, veg_coverage = _mean_and_coverage(ndvi)
     
     # Weighted score (0-100)
     score = ((mean_ndvi + 1) / 2 * 50) + (veg_coverage * 0.5)
@@ -3,15 +3,29 @@ Shared UI Components and Styling
 Consistent design system across all pages
 """
 
-def get_common_css():
-    """Return common CSS styling for all pages"""
-    return """
-    <style>
-        /* Import Google Fonts */
-        @import url('https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;600;700;800&family=Inter:wght@300;400;500;600;700&display=swap');
-        
-        /* Global Styles */
-        * {
+import re
+from functools import lru_cache
+
+import streamlit as st
+
+# Google Fonts (only weights the styles use; 400 is body text), loaded through
+# <link> tags instead of a CSS @import: the connections open while the page
+# is parsed and the font sheet no longer waits behind our own stylesheet
+_FONTS_URL = ("https://fonts.googleapis.com/css2?family=Poppins:wght@400;600;700;800"
+              "&family=Inter:wght@400;500;600;700&display=swap")
+_FONT_LINKS = ('<link rel="preconnect" href="https://fonts.googleapis.com">'
+               '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>'
+               f'<link rel="stylesheet" href="{_FONTS_URL}">')
+
+# Stylesheets for all pages, kept readable here and minified once at import.
+# The critical half covers what is on screen at first paint (page chrome,
+# headers, cards, alerts, buttons, tabs, sidebar shell, status boxes); the
+# deferred half styles widget details and is sent after the page content.
+_CRITICAL_CSS_SRC = """
+        /* Global Styles: set on the roots and inherited, plus the text tags
+           Streamlit styles with its own font, instead of matching every node */
+        html, body, .main, section[data-testid="stSidebar"],
+        h1, h2, h3, h4, h5, h6, p, label, button, input, select, textarea {
             font-family: 'Inter', 'Poppins', sans-serif;
         }
         
@@ -37,16 +51,9 @@ def get_common_css():
             text-align: center;
             padding: 1.5rem 0 0.5rem 0;
             margin-bottom: 0;
-            animation: gradientShift 5s ease infinite;
             letter-spacing: -1px;
         }
         
-        @keyframes gradientShift {
-            0% { background-position: 0% 50%; }
-            50% { background-position: 100% 50%; }
-            100% { background-position: 0% 50%; }
-        }
-        
         .page-subtitle {
             text-align: center;
             color: #495057;
@@ -60,7 +67,6 @@ def get_common_css():
         /* Enhanced metric cards */
         .metric-card {
             background: rgba(255, 255, 255, 0.95);
-            backdrop-filter: blur(10px);
             padding: 2rem;
             border-radius: 20px;
             border: 1px solid rgba(255, 255, 255, 0.3);
@@ -69,6 +75,11 @@ def get_common_css():
             transition: all 0.4s cubic-bezier(0.175, 0.885, 0.32, 1.275);
             position: relative;
             overflow: hidden;
+            contain: layout paint style;
+            /* Skip rendering cards scrolled out of view; 'auto' keeps the last
+               rendered height as the placeholder so the scrollbar does not jump */
+            content-visibility: auto;
+            contain-intrinsic-size: auto 260px;
         }
         
         .metric-card::before {
@@ -80,12 +91,6 @@ def get_common_css():
             height: 4px;
             background: linear-gradient(90deg, #667eea, #764ba2, #f093fb);
             background-size: 200% 100%;
-            animation: shimmer 3s ease-in-out infinite;
-        }
-        
-        @keyframes shimmer {
-            0%, 100% { background-position: -200% 0; }
-            50% { background-position: 200% 0; }
         }
         
         .metric-card:hover {
@@ -93,6 +98,37 @@ def get_common_css():
             box-shadow: 0 15px 45px rgba(102, 126, 234, 0.25);
         }
         
+        /* Card parts are scoped under .metric-card so they outrank the
+           heading and paragraph styles of Streamlit's markdown container */
+        .metric-card .metric-icon {
+            font-size: 3rem;
+            margin-bottom: 0.5rem;
+        }
+        
+        .metric-card .metric-label {
+            margin: 0;
+            color: #6c757d;
+            font-weight: 600;
+            font-size: 0.9rem;
+            text-transform: uppercase;
+            letter-spacing: 1px;
+        }
+        
+        .metric-card .metric-value {
+            margin: 0.5rem 0;
+            font-size: 3rem;
+            font-weight: 800;
+            background: linear-gradient(135deg, #667eea, #764ba2);
+            -webkit-background-clip: text;
+            -webkit-text-fill-color: transparent;
+        }
+        
+        .metric-card .metric-sub {
+            margin: 0;
+            color: #6c757d;
+            font-weight: 500;
+        }
+        
         /* Section headers */
         .section-header {
             font-size: 2rem;
@@ -116,47 +152,54 @@ def get_common_css():
             border-radius: 2px;
         }
         
-        /* Alert boxes */
+        /* Alert boxes: the shared box model and the severity colours are
+           generated from _ALERT_SEVERITIES; only the critical extras live here */
         .alert-critical {
-            background: linear-gradient(135deg, rgba(255, 65, 108, 0.15) 0%, rgba(255, 69, 86, 0.15) 100%);
-            border-left: 5px solid #ff416c;
-            padding: 1.5rem;
-            border-radius: 15px;
-            margin: 1rem 0;
-            box-shadow: 0 5px 20px rgba(255, 65, 108, 0.2);
-            animation: pulse 2s ease-in-out infinite;
+            position: relative;
         }
         
-        @keyframes pulse {
-            0%, 100% { box-shadow: 0 5px 20px rgba(255, 65, 108, 0.2); }
-            50% { box-shadow: 0 5px 30px rgba(255, 65, 108, 0.4); }
+        /* The pulse glow lives on its own layer so only its opacity animates */
+        .alert-critical::after {
+            content: '';
+            position: absolute;
+            inset: 0;
+            border-radius: inherit;
+            box-shadow: 0 5px 30px rgba(255, 65, 108, 0.4);
+            opacity: 0;
+            pointer-events: none;
         }
         
-        .alert-high {
-            background: linear-gradient(135deg, rgba(247, 151, 30, 0.15) 0%, rgba(255, 210, 0, 0.15) 100%);
-            border-left: 5px solid #f7971e;
-            padding: 1.5rem;
-            border-radius: 15px;
-            margin: 1rem 0;
-            box-shadow: 0 5px 20px rgba(247, 151, 30, 0.2);
+        /* Animations, only for users who have not asked for reduced motion;
+           the card shimmer runs on hover instead of forever */
+        @keyframes gradientShift {
+            0% { background-position: 0% 50%; }
+            50% { background-position: 100% 50%; }
+            100% { background-position: 0% 50%; }
         }
         
-        .alert-moderate {
-            background: linear-gradient(135deg, rgba(255, 193, 7, 0.15) 0%, rgba(255, 213, 79, 0.15) 100%);
-            border-left: 5px solid #ffc107;
-            padding: 1.5rem;
-            border-radius: 15px;
-            margin: 1rem 0;
-            box-shadow: 0 5px 20px rgba(255, 193, 7, 0.2);
+        @keyframes shimmer {
+            0%, 100% { background-position: -200% 0; }
+            50% { background-position: 200% 0; }
         }
         
-        .alert-low {
-            background: linear-gradient(135deg, rgba(40, 167, 69, 0.15) 0%, rgba(92, 184, 92, 0.15) 100%);
-            border-left: 5px solid #28a745;
-            padding: 1.5rem;
-            border-radius: 15px;
-            margin: 1rem 0;
-            box-shadow: 0 5px 20px rgba(40, 167, 69, 0.2);
+        @keyframes pulse {
+            0%, 100% { opacity: 0; }
+            50% { opacity: 1; }
+        }
+        
+        @media (prefers-reduced-motion: no-preference) {
+            .page-title {
+                animation: gradientShift 5s ease infinite;
+            }
+            
+            .metric-card:hover::before {
+                animation: shimmer 3s ease-in-out infinite;
+                will-change: background-position;
+            }
+            
+            .alert-critical::after {
+                animation: pulse 2s ease-in-out infinite;
+            }
         }
         
         /* Enhanced buttons */
@@ -207,20 +250,6 @@ def get_common_css():
             border-color: transparent !important;
         }
         
-        /* Data containers */
-        div[data-testid="stDataFrame"], div[data-testid="stTable"] {
-            border-radius: 15px;
-            overflow: hidden;
-            box-shadow: 0 5px 20px rgba(0,0,0,0.1);
-        }
-        
-        /* Expander styling */
-        .streamlit-expanderHeader {
-            background: linear-gradient(135deg, rgba(102, 126, 234, 0.1), rgba(118, 75, 162, 0.1));
-            border-radius: 10px;
-            font-weight: 600;
-        }
-        
         /* Sidebar styling - Elegant & Clean */
         section[data-testid="stSidebar"] {
             background: linear-gradient(180deg, 
@@ -228,7 +257,6 @@ def get_common_css():
                 rgba(118, 75, 162, 0.05) 50%,
                 rgba(240, 147, 251, 0.03) 100%
             );
-            backdrop-filter: blur(20px);
             box-shadow: 2px 0 30px rgba(102, 126, 234, 0.08);
             border-right: 1px solid rgba(102, 126, 234, 0.1);
         }
@@ -269,6 +297,56 @@ def get_common_css():
             );
         }
         
+        /* Success/Info/Warning/Error boxes */
+        .stSuccess {
+            background: linear-gradient(135deg, rgba(40, 167, 69, 0.1), rgba(92, 184, 92, 0.1)) !important;
+            border-radius: 15px !important;
+            border-left: 5px solid #28a745 !important;
+            box-shadow: 0 5px 20px rgba(40, 167, 69, 0.1) !important;
+        }
+        
+        .stInfo {
+            background: linear-gradient(135deg, rgba(23, 162, 184, 0.1), rgba(102, 126, 234, 0.1)) !important;
+            border-radius: 15px !important;
+            border-left: 5px solid #17a2b8 !important;
+            box-shadow: 0 5px 20px rgba(23, 162, 184, 0.1) !important;
+        }
+        
+        .stWarning {
+            background: linear-gradient(135deg, rgba(255, 193, 7, 0.1), rgba(253, 126, 20, 0.1)) !important;
+            border-radius: 15px !important;
+            border-left: 5px solid #ffc107 !important;
+            box-shadow: 0 5px 20px rgba(255, 193, 7, 0.1) !important;
+        }
+        
+        .stError {
+            background: linear-gradient(135deg, rgba(220, 53, 69, 0.1), rgba(255, 65, 108, 0.1)) !important;
+            border-radius: 15px !important;
+            border-left: 5px solid #dc3545 !important;
+            box-shadow: 0 5px 20px rgba(220, 53, 69, 0.1) !important;
+        }
+        
+        /* Loading animation */
+        .stSpinner > div {
+            border-top-color: #667eea !important;
+        }
+"""
+
+_DEFERRED_CSS_SRC = """
+        /* Data containers */
+        div[data-testid="stDataFrame"], div[data-testid="stTable"] {
+            border-radius: 15px;
+            overflow: hidden;
+            box-shadow: 0 5px 20px rgba(0,0,0,0.1);
+        }
+        
+        /* Expander styling */
+        .streamlit-expanderHeader {
+            background: linear-gradient(135deg, rgba(102, 126, 234, 0.1), rgba(118, 75, 162, 0.1));
+            border-radius: 10px;
+            font-weight: 600;
+        }
+        
         /* Sidebar widgets (selectbox, slider, etc.) */
         section[data-testid="stSidebar"] .stSelectbox label,
         section[data-testid="stSidebar"] .stSlider label,
@@ -327,7 +405,6 @@ def get_common_css():
             border-left: 4px solid #667eea !important;
             border-radius: 10px !important;
             padding: 1rem !important;
-            backdrop-filter: blur(10px);
         }
         
         /* Sidebar metric containers */
@@ -390,40 +467,6 @@ def get_common_css():
             border: 1px solid rgba(102, 126, 234, 0.1);
         }
         
-        /* Success/Info/Warning/Error boxes */
-        .stSuccess {
-            background: linear-gradient(135deg, rgba(40, 167, 69, 0.1), rgba(92, 184, 92, 0.1)) !important;
-            border-radius: 15px !important;
-            border-left: 5px solid #28a745 !important;
-            box-shadow: 0 5px 20px rgba(40, 167, 69, 0.1) !important;
-        }
-        
-        .stInfo {
-            background: linear-gradient(135deg, rgba(23, 162, 184, 0.1), rgba(102, 126, 234, 0.1)) !important;
-            border-radius: 15px !important;
-            border-left: 5px solid #17a2b8 !important;
-            box-shadow: 0 5px 20px rgba(23, 162, 184, 0.1) !important;
-        }
-        
-        .stWarning {
-            background: linear-gradient(135deg, rgba(255, 193, 7, 0.1), rgba(253, 126, 20, 0.1)) !important;
-            border-radius: 15px !important;
-            border-left: 5px solid #ffc107 !important;
-            box-shadow: 0 5px 20px rgba(255, 193, 7, 0.1) !important;
-        }
-        
-        .stError {
-            background: linear-gradient(135deg, rgba(220, 53, 69, 0.1), rgba(255, 65, 108, 0.1)) !important;
-            border-radius: 15px !important;
-            border-left: 5px solid #dc3545 !important;
-            box-shadow: 0 5px 20px rgba(220, 53, 69, 0.1) !important;
-        }
-        
-        /* Loading animation */
-        .stSpinner > div {
-            border-top-color: #667eea !important;
-        }
-        
         /* Input fields */
         .stTextInput > div > div > input,
         .stNumberInput > div > div > input,
@@ -454,31 +497,125 @@ def get_common_css():
         .stCheckbox > label > div {
             border-color: #667eea;
         }
-    </style>
+"""
+
+
+
+def _minify_css(css):
+    """Strip comments and collapse whitespace around CSS punctuation"""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{}:;,>])\s*", r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+# Alert severities: (name, main colour, gradient accent colour). The main
+# colour drives the left border, the gradient start and the shadow.
+_ALERT_SEVERITIES = (
+    ("critical", (255, 65, 108), (255, 69, 86)),
+    ("high", (247, 151, 30), (255, 210, 0)),
+    ("moderate", (255, 193, 7), (255, 213, 79)),
+    ("low", (40, 167, 69), (92, 184, 92)),
+)
+
+
+def _alert_css():
+    """
+    Generate the alert rules from _ALERT_SEVERITIES
+    
+    The box model is shared by .alert and every severity class, so markup
+    using a bare alert-* class keeps working next to "alert alert-*".
     """
+    selectors = ", ".join([".alert"] + [f".alert-{name}" for name, _, _ in _ALERT_SEVERITIES])
+    rules = [f"{selectors} {{ padding: 1.5rem; border-radius: 15px; margin: 1rem 0; border-left: 5px solid; }}"]
+    for name, (r, g, b), (r2, g2, b2) in _ALERT_SEVERITIES:
+        rules.append(
+            f".alert-{name} {{ "
+            f"background: linear-gradient(135deg, rgba({r}, {g}, {b}, 0.15) 0%, rgba({r2}, {g2}, {b2}, 0.15) 100%); "
+            f"border-left-color: #{r:02x}{g:02x}{b:02x}; "
+            f"box-shadow: 0 5px 20px rgba({r}, {g}, {b}, 0.2); }}"
+        )
+    return "\n".join(rules)
+
+
+_CRITICAL_CSS_MIN = _minify_css(_alert_css() + _CRITICAL_CSS_SRC)
+_DEFERRED_CSS_MIN = _minify_css(_DEFERRED_CSS_SRC)
+
+_CRITICAL_CSS = f"<style>{_CRITICAL_CSS_MIN}</style>"
+_DEFERRED_CSS = f"<style>{_DEFERRED_CSS_MIN}</style>"
+_COMMON_CSS = f"<style>{_CRITICAL_CSS_MIN}{_DEFERRED_CSS_MIN}</style>"
+
+
+def get_common_css():
+    """Return common CSS styling for all pages (critical and deferred together)"""
+    return _COMMON_CSS
+
+
+def get_font_links():
+    """Return the <link> tags that load the web fonts"""
+    return _FONT_LINKS
+
+
+def get_critical_css():
+    """Return the CSS needed for first paint"""
+    return _CRITICAL_CSS
+
+
+def get_deferred_css():
+    """Return the CSS that can wait until the page content has been sent"""
+    return _DEFERRED_CSS
+
+
+def inject_critical_css():
+    """
+    Emit the first-paint stylesheet; call before any page content
+    
+    Called on every run on purpose: Streamlit drops any element a rerun does
+    not re-emit, so a once-per-session guard would strip the styling after
+    the first interaction.
+    """
+    st.markdown(get_font_links() + get_critical_css(), unsafe_allow_html=True)
+
+
+def inject_deferred_css():
+    """Emit the remaining stylesheet; call at the end of the page"""
+    st.markdown(get_deferred_css(), unsafe_allow_html=True)
+
+
+def inject_common_css():
+    """Emit the font links and the whole common stylesheet at once"""
+    st.markdown(get_font_links() + get_common_css(), unsafe_allow_html=True)
+
+
+@lru_cache(maxsize=64)
+def _page_header_html(icon, title, subtitle):
+    """Build the title and subtitle as one element, once per distinct header"""
+    html = f'<p class="page-title">{icon} {title}</p>'
+    if subtitle:
+        html += f'<p class="page-subtitle">{subtitle}</p>'
+    return html
+
+
+@lru_cache(maxsize=64)
+def _section_header_html(title):
+    """Build the section header markup once per distinct title"""
+    return f'<h2 class="section-header">{title}</h2>'
 
 
 def page_header(icon, title, subtitle=""):
     """Create consistent page header"""
-    import streamlit as st
-    st.markdown(f'<p class="page-title">{icon} {title}</p>', unsafe_allow_html=True)
-    if subtitle:
-        st.markdown(f'<p class="page-subtitle">{subtitle}</p>', unsafe_allow_html=True)
+    st.markdown(_page_header_html(icon, title, subtitle), unsafe_allow_html=True)
 
 
 def section_header(title):
     """Create section header"""
-    import streamlit as st
-    st.markdown(f'<h2 class="section-header">{title}</h2>', unsafe_allow_html=True)
+    st.markdown(_section_header_html(title), unsafe_allow_html=True)
 
 
+@lru_cache(maxsize=256)
 def metric_card(icon, label, value, sublabel=""):
-    """Create a metric card"""
-    return f"""
-    <div class="metric-card">
-        <div style="font-size: 3rem; margin-bottom: 0.5rem;">{icon}</div>
-        <h4 style="margin:0; color: #6c757d; font-weight: 600; font-size: 0.9rem; text-transform: uppercase; letter-spacing: 1px;">{label}</h4>
-        <h1 style="margin:0.5rem 0; font-size: 3rem; font-weight: 800; background: linear-gradient(135deg, #667eea, #764ba2); -webkit-background-clip: text; -webkit-text-fill-color: transparent;">{value}</h1>
-        {f'<p style="margin:0; color: #6c757d; font-weight: 500;">{sublabel}</p>' if sublabel else ''}
-    </div>
-    """
+    """Create a metric card (memoized; the same cards recur on every rerun)"""
+    sub = f'<p class="metric-sub">{sublabel}</p>' if sublabel else ''
+    return (f'<div class="metric-card"><div class="metric-icon">{icon}</div>'
+            f'<h4 class="metric-label">{label}</h4>'
+            f'<h1 class="metric-value">{value}</h1>{sub}</div>')